@@ -6,22 +6,64 @@ Polls the Aztec staking registry for provider queue length and exposes raw
 Prometheus metrics. Alert thresholds and routing are owned by Grafana.
 """
 
+import json
 import logging
 import os
 import sys
+import threading
 import time
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse
 
-from prometheus_client import Counter, Gauge, start_http_server
+import requests
+from eth_account import Account
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 
 PROVIDER_ID = os.getenv("PROVIDER_ID", "")
+# Comma-separated provider IDs to watch, each optionally as <id>@<registry>; defaults to PROVIDER_ID
+PROVIDER_IDS = os.getenv("PROVIDER_IDS") or PROVIDER_ID
 L1_RPC_URL = os.getenv("L1_RPC_URL", "")
 NETWORK = os.getenv("NETWORK", "mainnet").lower()
 POLL_INTERVAL = int(os.getenv("PROVIDER_KEY_MONITOR_POLL_INTERVAL", "300"))
 METRICS_PORT = int(os.getenv("METRICS_PORT", "9102"))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# Optional directory for state kept across restarts; empty disables persistence
+DATA_PATH = os.getenv("DATA_PATH", "")
 RPC_TIMEOUT = int(os.getenv("RPC_TIMEOUT", "30"))
+RPC_CONNECT_TIMEOUT = float(os.getenv("RPC_CONNECT_TIMEOUT", "5"))
+# Keep-alive connections kept open per RPC URL
+RPC_POOL_MAXSIZE = int(os.getenv("RPC_POOL_MAXSIZE", "4"))
+# Most eth_calls sent in one JSON-RPC batch request
+RPC_BATCH_SIZE = int(os.getenv("RPC_BATCH_SIZE", "100"))
+
+# Page through queued keys and cross-check them against the local keystore
+QUEUE_INDEX_ENABLED = os.getenv("QUEUE_INDEX_ENABLED", "false").lower() == "true"
+KEYSTORE_PATH = os.getenv("KEYSTORE_PATH", "/keystore")
+KEYSTORE_FILES = ("sequencers.json", "sequencer.json")
+
+# Seconds between staking registry log checks between polls; 0 disables event-driven refresh
+LOG_POLL_INTERVAL = int(os.getenv("LOG_POLL_INTERVAL", "12"))
+LOG_MAX_BLOCK_RANGE = int(os.getenv("LOG_MAX_BLOCK_RANGE", "5000"))
+
+# Queue length samples kept per provider for depletion forecasting
+QUEUE_HISTORY_SIZE = int(os.getenv("QUEUE_HISTORY_SIZE", "2016"))
+# Seconds of history the consumption rate is averaged over
+QUEUE_RATE_WINDOW = float(os.getenv("QUEUE_RATE_WINDOW", "21600"))
+QUEUE_TREND_ALPHA = float(os.getenv("QUEUE_TREND_ALPHA", "0.2"))
+
+# Endpoint scoring, hedging and circuit breaking across the configured L1 RPC URLs
+RPC_EWMA_ALPHA = float(os.getenv("RPC_EWMA_ALPHA", "0.3"))
+RPC_ERROR_PENALTY = float(os.getenv("RPC_ERROR_PENALTY", "10"))
+RPC_HEDGE_MIN_DELAY = float(os.getenv("RPC_HEDGE_MIN_DELAY", "0.5"))
+RPC_BREAKER_FAILURES = int(os.getenv("RPC_BREAKER_FAILURES", "3"))
+RPC_BREAKER_COOLDOWN = float(os.getenv("RPC_BREAKER_COOLDOWN", "60"))
 
 CONTRACTS = {
     "mainnet": {
@@ -40,6 +82,13 @@ QUEUE_LENGTH_SIGNATURES = (
     "getProviderQueueLength(uint16)",
     "getProviderQueueLength(uint8)",
 )
+QUEUE_LENGTH_SELECTORS = {
+    signature: Web3.keccak(text=signature)[:4].hex() for signature in QUEUE_LENGTH_SIGNATURES
+}
+# Queue positions run from the first index up to, not including, the last index
+QUEUE_FIRST_INDEX_SIGNATURE = "getFirstIndexInQueue(uint256)"
+QUEUE_LAST_INDEX_SIGNATURE = "getLastIndexInQueue(uint256)"
+QUEUE_ENTRY_SIGNATURE = "getValueAtIndexInQueue(uint256,uint128)"
 
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL, logging.INFO),
@@ -68,6 +117,402 @@ PROVIDER_QUEUE_UP = Gauge(
     "Whether the Aztec provider queue poll succeeded on the latest attempt (1=yes, 0=no)",
     ["provider_id"],
 )
+PROVIDER_QUEUE_CONSUMPTION_RATE = Gauge(
+    "aztec_provider_queue_consumption_rate",
+    "Sequencer keys taken from the provider queue per second, averaged over the rate window",
+    ["provider_id"],
+)
+PROVIDER_QUEUE_TREND = Gauge(
+    "aztec_provider_queue_trend",
+    "EWMA of the provider queue length change per second, negative while the queue drains",
+    ["provider_id"],
+)
+PROVIDER_QUEUE_SECONDS_UNTIL_EMPTY = Gauge(
+    "aztec_provider_queue_seconds_until_empty",
+    "Estimated seconds until the provider queue is empty at the current consumption rate (+Inf when not draining)",
+    ["provider_id"],
+)
+PROVIDER_QUEUE_EVENT_REFRESHES = Counter(
+    "aztec_provider_queue_event_refreshes_total",
+    "Provider queue polls triggered by a staking registry log between scheduled polls",
+    ["provider_id"],
+)
+PROVIDER_QUEUE_INDEXED_KEYS = Gauge(
+    "aztec_provider_queue_indexed_keys",
+    "Sequencer keys in the local index of the provider queue",
+    ["provider_id"],
+)
+PROVIDER_QUEUE_KEYS_WITHOUT_LOCAL_KEY = Gauge(
+    "aztec_provider_queue_keys_without_local_key",
+    "Queued attester addresses with no matching key in the local keystore",
+    ["provider_id"],
+)
+PROVIDER_QUEUE_LOCAL_KEYS_NOT_QUEUED = Gauge(
+    "aztec_provider_queue_local_keys_not_queued",
+    "Local keystore attester addresses not in the provider queue",
+    ["provider_id"],
+)
+PROVIDER_QUEUE_CHECK_DURATION = Gauge(
+    "aztec_provider_queue_check_duration_seconds",
+    "Wall time of the latest scheduled provider queue check, from the first RPC request to the last metric update",
+)
+PROVIDER_QUEUE_CALLS = Counter(
+    "aztec_provider_queue_calls_total",
+    "getProviderQueueLength eth_calls by endpoint, signature and outcome "
+    "(success, revert, timeout, connection_error, error)",
+    ["endpoint", "signature", "outcome"],
+)
+RPC_REQUEST_DURATION = Histogram(
+    "aztec_provider_rpc_request_duration_seconds",
+    "L1 RPC HTTP request latency by endpoint and JSON-RPC method; eth_call batches count once",
+    ["endpoint", "method"],
+)
+RPC_REQUESTS = Counter(
+    "aztec_provider_rpc_requests_total",
+    "L1 RPC requests by endpoint and whether they opened a new connection or reused a pooled one",
+    ["endpoint", "connection"],
+)
+RPC_ENDPOINT_LATENCY = Gauge(
+    "aztec_provider_rpc_endpoint_latency_seconds",
+    "EWMA latency of successful requests by L1 RPC endpoint",
+    ["endpoint"],
+)
+RPC_ENDPOINT_ERROR_RATE = Gauge(
+    "aztec_provider_rpc_endpoint_error_rate",
+    "EWMA request error rate by L1 RPC endpoint",
+    ["endpoint"],
+)
+RPC_ENDPOINT_CIRCUIT_OPEN = Gauge(
+    "aztec_provider_rpc_endpoint_circuit_open",
+    "Whether the L1 RPC endpoint is skipped after repeated failures (1=yes, 0=no)",
+    ["endpoint"],
+)
+
+
+class RpcClient:
+    """
+    Long-lived Web3 client for one RPC URL on a keep-alive session, with EWMA
+    latency and error-rate statistics and a circuit breaker.
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+        # Host only, so API keys in userinfo or paths stay out of metric labels
+        self.label = urlparse(url).netloc.rsplit("@", 1)[-1] or url
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=RPC_POOL_MAXSIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        provider = Web3.HTTPProvider(
+            url,
+            request_kwargs={"timeout": (RPC_CONNECT_TIMEOUT, RPC_TIMEOUT)},
+            session=self.session,
+            # Failover to the next endpoint replaces retries on a hung one
+            exception_retry_configuration=None,
+        )
+        # No default middleware: the validation middleware would add an
+        # eth_chainId round trip in front of every eth_call
+        self.web3 = Web3(provider, middleware=[])
+        self.latency_ewma = 0.0
+        self.error_ewma = 0.0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+
+    def score(self) -> float:
+        """Lower is better. Unmeasured endpoints score 0 so they get tried."""
+        return self.latency_ewma + self.error_ewma * RPC_ERROR_PENALTY
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait on this endpoint before racing the next one."""
+        return max(RPC_HEDGE_MIN_DELAY, self.latency_ewma * 2)
+
+    def is_open(self, now: float) -> bool:
+        """Whether the breaker is open and its cooldown has not ended."""
+        return now < self.open_until
+
+    def allow_request(self) -> bool:
+        """
+        Whether a request may go to this endpoint. An open breaker rejects
+        requests until its cooldown ends. Then one trial request is let
+        through, and its outcome closes or reopens the breaker.
+        """
+        with self._lock:
+            if self.open_until == 0.0:
+                return True
+            now = time.time()
+            if now < self.open_until:
+                return False
+            # Half-open: the trial holds the breaker shut to other callers
+            # until its outcome is recorded
+            self.open_until = now + RPC_BREAKER_COOLDOWN
+            return True
+
+    def record(self, latency: float, ok: bool):
+        with self._lock:
+            if ok:
+                if self.latency_ewma == 0.0:
+                    self.latency_ewma = latency
+                else:
+                    self.latency_ewma += RPC_EWMA_ALPHA * (latency - self.latency_ewma)
+                self.consecutive_failures = 0
+                self.open_until = 0.0
+            else:
+                self.consecutive_failures += 1
+                if self.consecutive_failures >= RPC_BREAKER_FAILURES:
+                    self.open_until = time.time() + RPC_BREAKER_COOLDOWN
+            self.error_ewma += RPC_EWMA_ALPHA * ((0.0 if ok else 1.0) - self.error_ewma)
+            circuit_open = self.open_until > 0.0
+
+        RPC_ENDPOINT_LATENCY.labels(self.label).set(self.latency_ewma)
+        RPC_ENDPOINT_ERROR_RATE.labels(self.label).set(self.error_ewma)
+        RPC_ENDPOINT_CIRCUIT_OPEN.labels(self.label).set(1 if circuit_open else 0)
+
+    def _connections_opened(self) -> int:
+        pools = self.session.get_adapter(self.url).poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def call_batch(self, transactions: list[dict]) -> list[bytes | Exception]:
+        """
+        Run eth_calls as JSON-RPC batch requests of up to RPC_BATCH_SIZE calls.
+        Each call's result is its return data, or the error it came back with.
+        A transport error or a rejected batch raises.
+        """
+        results: list[bytes | Exception] = []
+        for start in range(0, len(transactions), RPC_BATCH_SIZE):
+            chunk = transactions[start:start + RPC_BATCH_SIZE]
+            opened = self._connections_opened()
+            started = time.monotonic()
+            try:
+                responses = self.web3.provider.make_batch_request(
+                    [("eth_call", [transaction, "latest"]) for transaction in chunk],
+                )
+            except Exception:
+                self.record(time.monotonic() - started, ok=False)
+                raise
+            finally:
+                RPC_REQUEST_DURATION.labels(self.label, "eth_call").observe(time.monotonic() - started)
+                reused = self._connections_opened() == opened
+                RPC_REQUESTS.labels(self.label, "reused" if reused else "new").inc()
+
+            if not isinstance(responses, list) or len(responses) != len(chunk):
+                self.record(time.monotonic() - started, ok=False)
+                error = responses.get("error") if isinstance(responses, dict) else responses
+                raise ValueError(f"batch request rejected: {error}")
+            self.record(time.monotonic() - started, ok=True)
+            for response in responses:
+                if "error" in response:
+                    results.append(ValueError(response["error"]))
+                else:
+                    results.append(bytes.fromhex(response["result"].removeprefix("0x")))
+        return results
+
+    def request(self, method: str, params: list):
+        """Send one JSON-RPC request and return its raw result; an error response raises."""
+        opened = self._connections_opened()
+        started = time.monotonic()
+        try:
+            response = self.web3.provider.make_request(method, params)
+            if "error" in response:
+                raise ValueError(response["error"])
+        except Exception:
+            self.record(time.monotonic() - started, ok=False)
+            raise
+        finally:
+            RPC_REQUEST_DURATION.labels(self.label, method).observe(time.monotonic() - started)
+            reused = self._connections_opened() == opened
+            RPC_REQUESTS.labels(self.label, "reused" if reused else "new").inc()
+        self.record(time.monotonic() - started, ok=True)
+        return response["result"]
+
+    def close(self):
+        self.session.close()
+
+
+class RpcClientRegistry:
+    """Creates one RpcClient per RPC URL on first use and hands it out afterwards."""
+
+    def __init__(self):
+        self._clients: dict[str, RpcClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> RpcClient:
+        with self._lock:
+            client = self._clients.get(url)
+            if client is None:
+                client = RpcClient(url)
+                # Keep endpoints on the same host apart in metric labels
+                if any(other.label == client.label for other in self._clients.values()):
+                    client.label = f"{client.label}#{len(self._clients)}"
+                self._clients[url] = client
+            return client
+
+    def ranked(self, urls: Iterable[str]) -> list[RpcClient]:
+        """
+        Clients for the URLs, best score first. Endpoints with an open
+        breaker go last; callers skip them with next_available.
+        """
+        now = time.time()
+        clients = [self.get(url) for url in urls]
+        return sorted(clients, key=lambda client: (client.is_open(now), client.score()))
+
+    def close(self):
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+
+def next_available(clients: Iterator[RpcClient]) -> RpcClient | None:
+    """Return the next client in a ranking whose breaker lets a request through."""
+    for client in clients:
+        if client.allow_request():
+            return client
+        logger.debug("Skipping %s, circuit breaker open", client.label)
+    return None
+
+
+RPC_CLIENTS = RpcClientRegistry()
+# Runs the racing per-endpoint attempts of one poll; losers finish in the background
+RACE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="rpc")
+
+
+@lru_cache(maxsize=None)
+def checksum_address(address: str) -> str:
+    return Web3.to_checksum_address(address)
+
+
+def write_json_atomic(path: Path, data: object):
+    """Write data as JSON to a temporary file and move it over path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    tmp_path.replace(path)
+
+
+class SignatureCache:
+    """
+    On-disk map from queue contract address to the getProviderQueueLength
+    signature that last answered, tried first on later polls.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._signatures: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if path is not None and path.exists():
+            try:
+                with open(path) as f:
+                    self._signatures = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning("Failed to read signature cache %s: %s", path, e)
+
+    def ordered(self, contract_address: str) -> list[str]:
+        """Return QUEUE_LENGTH_SIGNATURES with the remembered one first."""
+        with self._lock:
+            known = self._signatures.get(contract_address.lower())
+        if known not in QUEUE_LENGTH_SELECTORS:
+            return list(QUEUE_LENGTH_SIGNATURES)
+        return [known] + [signature for signature in QUEUE_LENGTH_SIGNATURES if signature != known]
+
+    def put(self, contract_address: str, signature: str):
+        with self._lock:
+            if self._signatures.get(contract_address.lower()) == signature:
+                return
+            self._signatures[contract_address.lower()] = signature
+            if self.path is None:
+                return
+            try:
+                write_json_atomic(self.path, self._signatures)
+            except IOError as e:
+                logger.warning("Failed to save signature cache %s: %s", self.path, e)
+
+
+SIGNATURE_CACHE = SignatureCache(Path(DATA_PATH) / "queue-signatures.json" if DATA_PATH else None)
+
+
+@dataclass(frozen=True)
+class QueueTarget:
+    """One provider queue to poll: a provider ID in a staking registry."""
+
+    provider_id: int
+    contract_address: str
+    label: str
+
+
+@dataclass(frozen=True)
+class QueueForecast:
+    consumption_rate: float
+    trend: float
+    seconds_until_empty: float
+
+
+class QueueHistory:
+    """
+    Ring buffer of (timestamp, queue length) samples per provider, saved to
+    disk after each poll so forecasts survive restarts.
+    """
+
+    def __init__(self, path: Path | None = None, size: int = QUEUE_HISTORY_SIZE):
+        self.path = path
+        self.size = size
+        self._samples: dict[str, deque[tuple[float, int]]] = {}
+
+        if path is not None and path.exists():
+            try:
+                with open(path) as f:
+                    for label, samples in json.load(f).items():
+                        self._samples[label] = deque(
+                            ((float(timestamp), int(length)) for timestamp, length in samples), maxlen=size,
+                        )
+            except (json.JSONDecodeError, IOError, TypeError, ValueError) as e:
+                logger.warning("Failed to read queue history %s: %s", path, e)
+
+    def record(self, label: str, timestamp: float, length: int):
+        samples = self._samples.setdefault(label, deque(maxlen=self.size))
+        if samples and timestamp <= samples[-1][0]:
+            return
+        samples.append((timestamp, length))
+
+    def forecast(self, label: str) -> QueueForecast | None:
+        """
+        Consumption rate counts only drops in queue length inside the rate
+        window, so key top-ups do not hide consumption. The trend is an EWMA
+        of the change per second between consecutive samples, top-ups
+        included.
+        """
+        samples = list(self._samples.get(label, ()))
+        if len(samples) < 2:
+            return None
+
+        trend = 0.0
+        for i, ((t0, l0), (t1, l1)) in enumerate(zip(samples, samples[1:])):
+            slope = (l1 - l0) / (t1 - t0)
+            trend = slope if i == 0 else trend + QUEUE_TREND_ALPHA * (slope - trend)
+
+        window_start = samples[-1][0] - QUEUE_RATE_WINDOW
+        recent = [sample for sample in samples if sample[0] >= window_start]
+        if len(recent) < 2:
+            recent = samples[-2:]
+        consumed = sum(max(0, l0 - l1) for (_, l0), (_, l1) in zip(recent, recent[1:]))
+        consumption_rate = consumed / (recent[-1][0] - recent[0][0])
+
+        length = samples[-1][1]
+        seconds_until_empty = length / consumption_rate if consumption_rate > 0 else float("inf")
+        return QueueForecast(consumption_rate, trend, seconds_until_empty)
+
+    def save(self):
+        if self.path is None:
+            return
+        try:
+            write_json_atomic(self.path, {label: list(samples) for label, samples in self._samples.items()})
+        except IOError as e:
+            logger.warning("Failed to save queue history %s: %s", self.path, e)
+
+
+QUEUE_HISTORY = QueueHistory(Path(DATA_PATH) / "queue-history.json" if DATA_PATH else None)
 
 
 def parse_rpc_urls(raw_urls: str) -> list[str]:
@@ -75,11 +520,35 @@ def parse_rpc_urls(raw_urls: str) -> list[str]:
     return [url.strip() for url in raw_urls.split(",") if url.strip()]
 
 
-def build_call_data(signature: str, provider_id: int) -> str:
-    """Build calldata for a provider queue length call."""
-    selector = Web3.keccak(text=signature)[:4].hex()
-    argument = provider_id.to_bytes(32, byteorder="big").hex()
-    return f"0x{selector}{argument}"
+def parse_queue_targets(raw_ids: str, default_contract_address: str) -> list[QueueTarget]:
+    """
+    Parse comma-separated provider IDs. An entry is `<id>` for the default
+    registry or `<id>@<registry address>` for another one, and is used as
+    the provider_id label as written.
+    """
+    targets = []
+    for entry in raw_ids.split(","):
+        label = entry.strip()
+        if not label:
+            continue
+        provider_id, _, contract_address = label.partition("@")
+        targets.append(QueueTarget(
+            provider_id=int(provider_id),
+            contract_address=contract_address or default_contract_address,
+            label=label,
+        ))
+    return targets
+
+
+@lru_cache(maxsize=None)
+def function_selector(signature: str) -> str:
+    return QUEUE_LENGTH_SELECTORS.get(signature) or Web3.keccak(text=signature)[:4].hex()
+
+
+def build_call_data(signature: str, *arguments: int) -> str:
+    """Build calldata for a registry call with unsigned integer arguments."""
+    encoded = "".join(argument.to_bytes(32, byteorder="big").hex() for argument in arguments)
+    return f"0x{function_selector(signature)}{encoded}"
 
 
 def decode_uint256(result: bytes) -> int:
@@ -90,102 +559,563 @@ def decode_uint256(result: bytes) -> int:
     return int.from_bytes(raw[-32:], byteorder="big")
 
 
-def call_queue_length(
+def decode_leading_address(result: bytes) -> str:
+    """Decode the address in the first word of an eth_call result, lowercase."""
+    raw = bytes(result)
+    if len(raw) < 32:
+        raise ValueError(f"expected at least 32 bytes, got {len(raw)}")
+    return "0x" + raw[12:32].hex()
+
+
+def call_outcome(error: Exception | None) -> str:
+    """Classify an eth_call result for aztec_provider_queue_calls_total."""
+    if error is None:
+        return "success"
+    if isinstance(error, requests.Timeout):
+        return "timeout"
+    if isinstance(error, requests.ConnectionError):
+        return "connection_error"
+    if isinstance(error, requests.RequestException):
+        return "error"
+    # An error response from the node or return data that does not decode
+    return "revert"
+
+
+def call_queue_lengths(
     rpc_url: str,
-    contract_address: str,
-    provider_id: int,
-    signatures: Iterable[str] = QUEUE_LENGTH_SIGNATURES,
-) -> int:
-    """Call getProviderQueueLength through one RPC URL."""
-    web3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": RPC_TIMEOUT}))
-    checksum_address = Web3.to_checksum_address(contract_address)
-    last_error: Exception | None = None
+    targets: Iterable[QueueTarget],
+    min_block: int | None = None,
+) -> dict[QueueTarget, int | Exception]:
+    """
+    Call getProviderQueueLength for every target through one RPC URL, all
+    targets in one batch request per attempt.
+
+    Each target first tries the signature that last answered for its
+    registry. Targets whose call failed are retried in the next batch with
+    their next signature. A transport error raises, since no signature would
+    get through. With min_block set, an endpoint whose head is below it
+    raises instead of answering with an older queue length.
+    """
+    client = RPC_CLIENTS.get(rpc_url)
+    if min_block is not None:
+        head = int(client.request("eth_blockNumber", []), 16)
+        if head < min_block:
+            raise RuntimeError(f"head block {head} is behind block {min_block}")
+    candidates = {target: SIGNATURE_CACHE.ordered(target.contract_address) for target in targets}
+    results: dict[QueueTarget, int | Exception] = {}
 
-    for signature in signatures:
+    while candidates:
+        attempts = [(target, signatures[0]) for target, signatures in candidates.items()]
         try:
-            call_data = build_call_data(signature, provider_id)
-            result = web3.eth.call({"to": checksum_address, "data": call_data})
-            value = decode_uint256(result)
-            logger.debug("Provider queue call succeeded with signature %s", signature)
-            return value
+            responses = client.call_batch([
+                {
+                    "to": checksum_address(target.contract_address),
+                    "data": build_call_data(signature, target.provider_id),
+                }
+                for target, signature in attempts
+            ])
         except Exception as exc:
-            last_error = exc
-            logger.debug("Provider queue call failed with signature %s: %s", signature, exc)
+            # A rejected batch is not a revert of the calls in it
+            outcome = call_outcome(exc) if isinstance(exc, requests.RequestException) else "error"
+            for _, signature in attempts:
+                PROVIDER_QUEUE_CALLS.labels(client.label, signature, outcome).inc()
+            raise
 
-    raise RuntimeError(f"all provider queue call signatures failed: {last_error}")
+        for (target, signature), response in zip(attempts, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                value = decode_uint256(response)
+            except Exception as exc:
+                PROVIDER_QUEUE_CALLS.labels(client.label, signature, call_outcome(exc)).inc()
+                logger.debug("Provider %s queue call failed with signature %s: %s", target.label, signature, exc)
+                candidates[target] = candidates[target][1:]
+                if not candidates[target]:
+                    del candidates[target]
+                    results[target] = RuntimeError(f"all provider queue call signatures failed: {exc}")
+                continue
 
+            PROVIDER_QUEUE_CALLS.labels(client.label, signature, "success").inc()
+            logger.debug("Provider %s queue call succeeded with signature %s", target.label, signature)
+            SIGNATURE_CACHE.put(target.contract_address, signature)
+            results[target] = value
+            del candidates[target]
 
-def fetch_provider_queue_length(
+    return results
+
+
+def fetch_provider_queue_lengths(
     rpc_urls: Iterable[str],
-    contract_address: str,
-    provider_id: int,
-) -> int:
-    """Fetch provider queue length, trying configured RPC URLs in order."""
+    targets: Iterable[QueueTarget],
+    min_block: int | None = None,
+) -> dict[QueueTarget, int | Exception]:
+    """
+    Fetch the queue length of every target, racing the configured RPC URLs.
+    With min_block set, only endpoints that have reached that block answer.
+
+    The best-scoring endpoint is asked first. The next one joins when the
+    leader has not answered within its hedge delay, or as soon as an attempt
+    fails or leaves targets unanswered. The first answer for each target
+    wins; slower attempts finish in the background and only update endpoint
+    statistics.
+    """
+    targets = list(targets)
+    endpoints = iter(RPC_CLIENTS.ranked(rpc_urls))
+    results: dict[QueueTarget, int | Exception] = {}
+    running: dict[Future, RpcClient] = {}
+
+    def launch() -> bool:
+        client = next_available(endpoints)
+        if client is None:
+            return False
+        running[RACE_POOL.submit(call_queue_lengths, client.url, targets, min_block)] = client
+        return True
+
+    exhausted = not launch()
+    while running:
+        leader = next(iter(running.values()))
+        done, _ = wait(
+            running, timeout=None if exhausted else leader.hedge_delay(), return_when=FIRST_COMPLETED,
+        )
+        if not done:
+            logger.debug("No answer from %s after %.2fs, racing the next endpoint", leader.label, leader.hedge_delay())
+            exhausted = not launch()
+            continue
+
+        failed = False
+        for future in done:
+            client = running.pop(future)
+            try:
+                answered = future.result()
+            except Exception as exc:
+                logger.warning("Provider queue poll failed via %s: %s", client.label, exc)
+                answered = {target: exc for target in targets}
+            for target, value in answered.items():
+                if not isinstance(value, Exception):
+                    if not isinstance(results.get(target), int):
+                        results[target] = value
+                    continue
+                failed = True
+                results.setdefault(target, value)
+                logger.warning("Provider %s queue poll failed via %s: %s", target.label, client.label, value)
+
+        if all(isinstance(results.get(target), int) for target in targets):
+            break
+        if failed and not exhausted:
+            exhausted = not launch()
+
+    return results
+
+
+def race_ranked(rpc_urls: Iterable[str], fn, description: str):
+    """
+    Run fn(client) on the best-ranked endpoint and race the next one when the
+    leader has not answered within its hedge delay or has failed. The first
+    successful result wins, so fn must not change shared state: slower
+    attempts finish in the background.
+    """
+    endpoints = iter(RPC_CLIENTS.ranked(rpc_urls))
+    running: dict[Future, RpcClient] = {}
     last_error: Exception | None = None
 
-    for rpc_url in rpc_urls:
+    def launch() -> bool:
+        client = next_available(endpoints)
+        if client is None:
+            return False
+        running[RACE_POOL.submit(fn, client)] = client
+        return True
+
+    exhausted = not launch()
+    while running:
+        leader = next(iter(running.values()))
+        done, _ = wait(
+            running, timeout=None if exhausted else leader.hedge_delay(), return_when=FIRST_COMPLETED,
+        )
+        if not done:
+            logger.debug("No answer from %s after %.2fs, racing the next endpoint", leader.label, leader.hedge_delay())
+            exhausted = not launch()
+            continue
+
+        for future in done:
+            client = running.pop(future)
+            try:
+                return future.result()
+            except Exception as exc:
+                last_error = exc
+                logger.warning("%s failed via %s: %s", description, client.label, exc)
+        if not exhausted:
+            exhausted = not launch()
+
+    if last_error is None:
+        raise RuntimeError("every configured L1 RPC URL has an open circuit breaker")
+    raise RuntimeError(f"all configured L1 RPC URLs failed: {last_error}")
+
+
+def call_ranked(rpc_urls: Iterable[str], fn, description: str):
+    """Run fn(client) on the best-ranked endpoint, moving down the ranking on errors."""
+    last_error: Exception | None = None
+    endpoints = iter(RPC_CLIENTS.ranked(rpc_urls))
+    while (client := next_available(endpoints)) is not None:
         try:
-            return call_queue_length(rpc_url, contract_address, provider_id)
+            return fn(client)
         except Exception as exc:
             last_error = exc
-            logger.warning("Provider queue poll failed via %s: %s", rpc_url, exc)
-
+            logger.warning("%s failed via %s: %s", description, client.label, exc)
+    if last_error is None:
+        raise RuntimeError("every configured L1 RPC URL has an open circuit breaker")
     raise RuntimeError(f"all configured L1 RPC URLs failed: {last_error}")
 
 
-def run_check() -> bool:
-    """Run one provider queue poll and update metrics."""
-    provider_id = int(PROVIDER_ID)
+def derive_attester_address(eth_key: str) -> str | None:
+    """Derive the lowercase address of an attester private key, or None if invalid."""
+    try:
+        return Account.from_key(eth_key).address.lower()
+    except Exception:
+        return None
+
+
+def load_validator_addresses(keystore_path: str) -> list[str]:
+    """
+    Read attester addresses from the keystore.
+
+    Tries sequencers.json first (has validator entries with attester keys),
+    falls back to sequencer.json.
+    """
+    addresses = []
+
+    for filename in KEYSTORE_FILES:
+        filepath = Path(keystore_path) / filename
+        if not filepath.exists():
+            continue
+
+        try:
+            with open(filepath) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning("Failed to read %s: %s", filepath, e)
+            continue
+
+        # attester.eth is a private key — derive the public address
+        for v in data.get("validators", []):
+            attester = v.get("attester", {})
+            eth_key = attester.get("eth", "") if isinstance(attester, dict) else ""
+            if not eth_key:
+                continue
+            address = derive_attester_address(eth_key)
+            if address is None:
+                logger.warning("Failed to derive address from attester key in %s", filename)
+                continue
+            addresses.append(address)
+
+        if addresses:
+            break
+
+    if not addresses:
+        logger.warning("No validator addresses found in keystore at %s", keystore_path)
+
+    return addresses
+
+
+class KeystoreIndex:
+    """Re-reads attester addresses whenever a keystore file's mtime changes."""
+
+    def __init__(self, keystore_path: str):
+        self.keystore_path = keystore_path
+        self._mtimes: dict[str, float | None] | None = None
+        self._addresses: frozenset[str] = frozenset()
+
+    def _current_mtimes(self) -> dict[str, float | None]:
+        mtimes = {}
+        for filename in KEYSTORE_FILES:
+            try:
+                mtimes[filename] = (Path(self.keystore_path) / filename).stat().st_mtime
+            except OSError:
+                mtimes[filename] = None
+        return mtimes
+
+    def addresses(self) -> frozenset[str]:
+        mtimes = self._current_mtimes()
+        if mtimes != self._mtimes:
+            self._mtimes = mtimes
+            self._addresses = frozenset(load_validator_addresses(self.keystore_path))
+        return self._addresses
+
+
+class QueueIndex:
+    """
+    Local copy of the attester addresses queued per provider, from the queue's
+    first index on. Keys taken off the front are dropped, and only positions
+    past the last indexed one are read from L1. Saved to disk after each
+    update.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        # provider label -> {"first": queue index of attesters[0], "attesters": [...]}
+        self._queues: dict[str, dict] = {}
+
+        if path is not None and path.exists():
+            try:
+                with open(path) as f:
+                    self._queues = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning("Failed to read queue index %s: %s", path, e)
+
+    def attesters(self, label: str) -> list[str]:
+        return self._queues.get(label, {}).get("attesters", [])
+
+    def update(self, client: RpcClient, targets: list[QueueTarget]) -> dict[QueueTarget, Exception]:
+        """
+        Bring the index of every target up to date through one client: one
+        batch for the queue bounds, then one for all new tail entries. Returns
+        the targets that could not be read.
+        """
+        bounds = client.call_batch([
+            {"to": checksum_address(target.contract_address), "data": build_call_data(signature, target.provider_id)}
+            for target in targets
+            for signature in (QUEUE_FIRST_INDEX_SIGNATURE, QUEUE_LAST_INDEX_SIGNATURE)
+        ])
+        errors: dict[QueueTarget, Exception] = {}
+        reads: list[tuple[QueueTarget, int]] = []
+
+        for i, target in enumerate(targets):
+            responses = bounds[2 * i:2 * i + 2]
+            try:
+                for response in responses:
+                    if isinstance(response, Exception):
+                        raise response
+                first, last = (decode_uint256(response) for response in responses)
+            except Exception as exc:
+                errors[target] = exc
+                continue
+
+            queue = self._queues.get(target.label)
+            indexed_end = queue["first"] + len(queue["attesters"]) if queue else None
+            if queue is None or not queue["first"] <= first <= indexed_end or last < indexed_end:
+                # First index, or the queue moved in a way a FIFO cannot: start over
+                queue = self._queues[target.label] = {"first": first, "attesters": []}
+                indexed_end = first
+            else:
+                del queue["attesters"][:first - queue["first"]]
+                queue["first"] = first
+            reads.extend((target, index) for index in range(indexed_end, last))
+
+        entries = client.call_batch([
+            {
+                "to": checksum_address(target.contract_address),
+                "data": build_call_data(QUEUE_ENTRY_SIGNATURE, target.provider_id, index),
+            }
+            for target, index in reads
+        ]) if reads else []
+
+        for (target, index), response in zip(reads, entries):
+            if target in errors:
+                continue
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                self._queues[target.label]["attesters"].append(decode_leading_address(response))
+            except Exception as exc:
+                # Keep the index contiguous; the rest of this tail is read again next time
+                errors[target] = exc
+
+        self.save()
+        return errors
+
+    def save(self):
+        if self.path is None:
+            return
+        try:
+            write_json_atomic(self.path, self._queues)
+        except IOError as e:
+            logger.warning("Failed to save queue index %s: %s", self.path, e)
+
+
+KEYSTORE = KeystoreIndex(KEYSTORE_PATH)
+QUEUE_INDEX = QueueIndex(Path(DATA_PATH) / "queue-index.json" if DATA_PATH else None)
+
+
+def refresh_queue_index(rpc_urls: list[str], targets: list[QueueTarget]):
+    """Update the queue index of the targets and export the keystore cross-check."""
+    errors = call_ranked(rpc_urls, lambda client: QUEUE_INDEX.update(client, targets), "Queue index update")
+    local = KEYSTORE.addresses()
+
+    for target in targets:
+        if target in errors:
+            logger.warning("Failed to index provider %s queue: %s", target.label, errors[target])
+            continue
+        attesters = QUEUE_INDEX.attesters(target.label)
+        queued = set(attesters)
+        PROVIDER_QUEUE_INDEXED_KEYS.labels(target.label).set(len(attesters))
+        PROVIDER_QUEUE_KEYS_WITHOUT_LOCAL_KEY.labels(target.label).set(
+            sum(1 for attester in attesters if attester not in local)
+        )
+        PROVIDER_QUEUE_LOCAL_KEYS_NOT_QUEUED.labels(target.label).set(len(local - queued))
+
+
+class RegistryLogWatcher:
+    """
+    Follows staking registry logs from a block checkpoint and reports the
+    watched providers they touch.
+
+    A log counts for a provider when one of its indexed topics equals the
+    provider ID, so any registry event keyed by provider triggers a refresh
+    without the registry ABI.
+    """
+
+    def __init__(self, targets: Iterable[QueueTarget]):
+        self.targets = {(target.contract_address.lower(), target.provider_id): target for target in targets}
+        self.addresses = sorted({checksum_address(address) for address, _ in self.targets})
+        self.checkpoint: int | None = None
+
+    def poll(self, rpc_urls: Iterable[str]) -> list[QueueTarget]:
+        """Return the providers touched by logs since the last check; the first call sets the checkpoint."""
+        checkpoint = self.checkpoint
+        self.checkpoint, touched = race_ranked(
+            rpc_urls, lambda client: self._poll(client, checkpoint), "Registry log check",
+        )
+        return touched
+
+    def _poll(self, client: RpcClient, checkpoint: int | None) -> tuple[int, list[QueueTarget]]:
+        """Scan logs after checkpoint on one endpoint; returns the new checkpoint and the touched providers."""
+        head = int(client.request("eth_blockNumber", []), 16)
+        if checkpoint is None:
+            return head, []
+
+        touched: dict[QueueTarget, None] = {}
+        # A lagging endpoint behind the checkpoint leaves this loop empty
+        while checkpoint < head:
+            end = min(head, checkpoint + LOG_MAX_BLOCK_RANGE)
+            logs = client.request("eth_getLogs", [{
+                "fromBlock": hex(checkpoint + 1),
+                "toBlock": hex(end),
+                "address": self.addresses,
+            }])
+            for log in logs:
+                for topic in log["topics"][1:]:
+                    target = self.targets.get((log["address"].lower(), int(topic, 16)))
+                    if target is not None:
+                        touched[target] = None
+            checkpoint = end
+        return checkpoint, list(touched)
+
+
+def run_check(targets: list[QueueTarget] | None = None, min_block: int | None = None) -> bool:
+    """
+    Run one poll of the given provider queues, or of all of them, and update
+    metrics. Only the scheduled poll of every queue sets the check duration
+    and adds forecast samples; event-triggered refreshes of a few providers
+    update just the queue lengths, read at min_block or later.
+    """
+    started = time.monotonic()
+    scheduled = targets is None
+    if targets is None:
+        targets = parse_queue_targets(PROVIDER_IDS, PROVIDER_QUEUE_CONTRACT_ADDRESS)
     rpc_urls = parse_rpc_urls(L1_RPC_URL)
 
     try:
-        queue_length = fetch_provider_queue_length(
-            rpc_urls,
-            PROVIDER_QUEUE_CONTRACT_ADDRESS,
-            provider_id,
-        )
-        PROVIDER_QUEUE_LENGTH.labels(PROVIDER_ID).set(queue_length)
-        PROVIDER_QUEUE_LAST_SUCCESS.labels(PROVIDER_ID).set(time.time())
-        PROVIDER_QUEUE_UP.labels(PROVIDER_ID).set(1)
-        logger.info("Provider %s queue length: %s", PROVIDER_ID, queue_length)
-        return True
+        results = fetch_provider_queue_lengths(rpc_urls, targets, min_block)
     except Exception as exc:
-        PROVIDER_QUEUE_POLL_ERRORS.labels(PROVIDER_ID).inc()
-        PROVIDER_QUEUE_UP.labels(PROVIDER_ID).set(0)
-        logger.error("Provider queue poll failed: %s", exc)
-        return False
+        results = {target: exc for target in targets}
+
+    succeeded = True
+    now = time.time()
+    for target in targets:
+        queue_length = results.get(target, RuntimeError("no RPC URL answered"))
+        if isinstance(queue_length, Exception):
+            PROVIDER_QUEUE_POLL_ERRORS.labels(target.label).inc()
+            PROVIDER_QUEUE_UP.labels(target.label).set(0)
+            logger.error("Provider %s queue poll failed: %s", target.label, queue_length)
+            succeeded = False
+            continue
+        PROVIDER_QUEUE_LENGTH.labels(target.label).set(queue_length)
+        PROVIDER_QUEUE_LAST_SUCCESS.labels(target.label).set(now)
+        PROVIDER_QUEUE_UP.labels(target.label).set(1)
+        logger.info("Provider %s queue length: %s", target.label, queue_length)
+
+        # Event-triggered refreshes would cluster samples around queue
+        # changes, so the forecast keeps to the evenly spaced scheduled polls
+        if not scheduled:
+            continue
+        QUEUE_HISTORY.record(target.label, now, queue_length)
+        forecast = QUEUE_HISTORY.forecast(target.label)
+        if forecast is not None:
+            PROVIDER_QUEUE_CONSUMPTION_RATE.labels(target.label).set(forecast.consumption_rate)
+            PROVIDER_QUEUE_TREND.labels(target.label).set(forecast.trend)
+            PROVIDER_QUEUE_SECONDS_UNTIL_EMPTY.labels(target.label).set(forecast.seconds_until_empty)
+
+    if scheduled:
+        QUEUE_HISTORY.save()
+
+    if QUEUE_INDEX_ENABLED:
+        try:
+            refresh_queue_index(rpc_urls, targets)
+        except Exception as exc:
+            logger.error("Queue index update failed: %s", exc)
+
+    if scheduled:
+        PROVIDER_QUEUE_CHECK_DURATION.set(time.monotonic() - started)
+    return succeeded
+
+
+def wait_for_next_poll(watcher: RegistryLogWatcher, rpc_urls: list[str], interval: int):
+    """
+    Sleep until the next scheduled poll. With event-driven refresh enabled,
+    check registry logs every LOG_POLL_INTERVAL seconds and poll the
+    providers a log touched right away.
+    """
+    deadline = time.time() + interval
+    if LOG_POLL_INTERVAL <= 0:
+        time.sleep(interval)
+        return
+
+    while (remaining := deadline - time.time()) > 0:
+        time.sleep(min(LOG_POLL_INTERVAL, remaining))
+        try:
+            touched = watcher.poll(rpc_urls)
+        except Exception as e:
+            logger.warning("Failed to read staking registry logs: %s", e)
+            continue
+        if touched:
+            logger.info("Registry logs touched provider(s) %s, refreshing", ", ".join(t.label for t in touched))
+            for target in touched:
+                PROVIDER_QUEUE_EVENT_REFRESHES.labels(target.label).inc()
+            # The logs came from an endpoint at the checkpoint; a lagging
+            # endpoint would still report the queue from before them
+            run_check(touched, watcher.checkpoint)
 
 
 def validate_config() -> None:
     """Validate required config before serving metrics."""
-    if not PROVIDER_ID:
-        logger.error("PROVIDER_ID is required")
-        sys.exit(1)
-
     try:
-        int(PROVIDER_ID)
+        targets = parse_queue_targets(PROVIDER_IDS, PROVIDER_QUEUE_CONTRACT_ADDRESS)
     except ValueError:
-        logger.error("PROVIDER_ID must be an integer, got %s", PROVIDER_ID)
+        logger.error("Provider IDs must be integers or <id>@<registry>, got %s", PROVIDER_IDS)
+        sys.exit(1)
+
+    if not targets:
+        logger.error("PROVIDER_ID or PROVIDER_IDS is required")
         sys.exit(1)
 
     if not parse_rpc_urls(L1_RPC_URL):
         logger.error("L1_RPC_URL is required")
         sys.exit(1)
 
-    if not PROVIDER_QUEUE_CONTRACT_ADDRESS:
-        logger.error("No provider queue contract address configured for network %s", NETWORK)
-        sys.exit(1)
+    for target in targets:
+        if not target.contract_address:
+            logger.error("No provider queue contract address configured for network %s", NETWORK)
+            sys.exit(1)
 
-    if not Web3.is_address(PROVIDER_QUEUE_CONTRACT_ADDRESS):
-        logger.error("Invalid provider queue contract address: %s", PROVIDER_QUEUE_CONTRACT_ADDRESS)
-        sys.exit(1)
+        if not Web3.is_address(target.contract_address):
+            logger.error("Invalid provider queue contract address: %s", target.contract_address)
+            sys.exit(1)
 
 
 def main() -> None:
     """Start metrics server and poll forever."""
     logger.info("=" * 60)
     logger.info("Aztec Provider Key Monitor starting")
-    logger.info("Provider ID: %s", PROVIDER_ID)
+    logger.info("Provider IDs: %s", PROVIDER_IDS)
     logger.info("Network: %s", NETWORK)
     logger.info("Poll Interval: %ss", POLL_INTERVAL)
     logger.info("Metrics Port: %s", METRICS_PORT)
@@ -194,14 +1124,25 @@ def main() -> None:
 
     validate_config()
 
-    PROVIDER_QUEUE_UP.labels(PROVIDER_ID).set(0)
+    targets = parse_queue_targets(PROVIDER_IDS, PROVIDER_QUEUE_CONTRACT_ADDRESS)
+    rpc_urls = parse_rpc_urls(L1_RPC_URL)
+    for target in targets:
+        PROVIDER_QUEUE_UP.labels(target.label).set(0)
     start_http_server(METRICS_PORT)
     logger.info("Prometheus metrics server started on :%s", METRICS_PORT)
 
+    # Set the log checkpoint before the first poll, so no log after it is missed
+    watcher = RegistryLogWatcher(targets)
+    if LOG_POLL_INTERVAL > 0:
+        try:
+            watcher.poll(rpc_urls)
+        except Exception as e:
+            logger.warning("Failed to read staking registry head: %s", e)
+
     while True:
         run_check()
-        logger.info("Sleeping for %s seconds", POLL_INTERVAL)
-        time.sleep(POLL_INTERVAL)
+        logger.info("Sleeping for up to %s seconds", POLL_INTERVAL)
+        wait_for_next_poll(watcher, rpc_urls, POLL_INTERVAL)
 
 
 if __name__ == "__main__":
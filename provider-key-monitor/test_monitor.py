@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 """Unit tests for the Aztec provider key monitor."""
 
+import json
 import os
 import sys
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+from eth_account import Account
+from prometheus_client import REGISTRY
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
@@ -17,6 +25,35 @@ os.environ["LOG_LEVEL"] = "ERROR"
 import monitor
 
 
+TARGET = monitor.QueueTarget(74, monitor.PROVIDER_QUEUE_CONTRACT_ADDRESS, "74")
+
+
+class FakeRpcHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON-RPC endpoint answering each eth_call with ten times the provider ID."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        batch = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.batches.append([request["method"] for request in batch])
+        body = json.dumps([
+            {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "result": "0x" + (int(request["params"][0]["data"][10:], 16) * 10).to_bytes(32, "big").hex(),
+            }
+            for request in batch
+        ]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
 class ProviderKeyMonitorTests(unittest.TestCase):
     def test_mainnet_default_uses_staking_registry(self):
         self.assertEqual(
@@ -46,21 +83,322 @@ class ProviderKeyMonitorTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             monitor.decode_uint256(b"\x01")
 
-    def test_fetch_provider_queue_length_tries_next_rpc(self):
-        with patch.object(monitor, "call_queue_length") as call_queue_length:
-            call_queue_length.side_effect = [RuntimeError("primary failed"), 250]
+    def test_parse_queue_targets(self):
+        registry = "0x" + "12" * 20
+
+        self.assertEqual(
+            monitor.parse_queue_targets(f"74, 75@{registry},", monitor.PROVIDER_QUEUE_CONTRACT_ADDRESS),
+            [
+                monitor.QueueTarget(74, monitor.PROVIDER_QUEUE_CONTRACT_ADDRESS, "74"),
+                monitor.QueueTarget(75, registry, f"75@{registry}"),
+            ],
+        )
+
+    def test_fetch_provider_queue_lengths_races_next_rpc_for_failed_targets(self):
+        self.addCleanup(monitor.RPC_CLIENTS.close)
+        other = monitor.QueueTarget(75, monitor.PROVIDER_QUEUE_CONTRACT_ADDRESS, "75")
+        calls = []
+
+        def call_queue_lengths(rpc_url, targets, min_block=None):
+            calls.append(rpc_url)
+            if rpc_url == "https://rpc-one.example":
+                return {TARGET: 250, other: RuntimeError("reverted")}
+            return {TARGET: 251, other: 30}
+
+        with patch.object(monitor, "call_queue_lengths", side_effect=call_queue_lengths):
+            results = monitor.fetch_provider_queue_lengths(
+                ["https://rpc-one.example", "https://rpc-two.example"],
+                [TARGET, other],
+            )
+
+        self.assertEqual(results, {TARGET: 250, other: 30})
+        self.assertEqual(calls, ["https://rpc-one.example", "https://rpc-two.example"])
+
+    def test_fetch_provider_queue_lengths_hedges_slow_rpc(self):
+        self.addCleanup(monitor.RPC_CLIENTS.close)
+        release = threading.Event()
+        self.addCleanup(release.set)
 
-            value = monitor.fetch_provider_queue_length(
+        def call_queue_lengths(rpc_url, targets, min_block=None):
+            if rpc_url == "https://rpc-one.example":
+                release.wait(5)
+            return {TARGET: 250}
+
+        started = time.monotonic()
+        with patch.object(monitor, "RPC_HEDGE_MIN_DELAY", 0.05), \
+                patch.object(monitor, "call_queue_lengths", side_effect=call_queue_lengths):
+            results = monitor.fetch_provider_queue_lengths(
                 ["https://rpc-one.example", "https://rpc-two.example"],
-                monitor.PROVIDER_QUEUE_CONTRACT_ADDRESS,
-                74,
+                [TARGET],
+            )
+
+        self.assertEqual(results, {TARGET: 250})
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_event_refresh_ignores_endpoint_behind_the_log_block(self):
+        self.addCleanup(monitor.RPC_CLIENTS.close)
+        heads = {"https://rpc-one.example": "0x190", "https://rpc-two.example": "0x1f4"}
+        lengths = {"https://rpc-one.example": 250, "https://rpc-two.example": 249}
+
+        def request(client, method, params):
+            return heads[client.url]
+
+        def call_batch(client, transactions):
+            return [lengths[client.url].to_bytes(32, "big") for _ in transactions]
+
+        with patch.object(monitor.RpcClient, "request", autospec=True, side_effect=request), \
+                patch.object(monitor.RpcClient, "call_batch", autospec=True, side_effect=call_batch):
+            results = monitor.fetch_provider_queue_lengths(
+                ["https://rpc-one.example", "https://rpc-two.example"], [TARGET], min_block=500,
+            )
+
+        self.assertEqual(results, {TARGET: 249})
+
+    def test_circuit_breaker_ranks_failing_endpoint_last(self):
+        self.addCleanup(monitor.RPC_CLIENTS.close)
+        failing = monitor.RPC_CLIENTS.get("https://rpc-one.example")
+        for _ in range(monitor.RPC_BREAKER_FAILURES):
+            failing.record(0.1, ok=False)
+        monitor.RPC_CLIENTS.get("https://rpc-two.example").record(2.0, ok=True)
+
+        ranked = monitor.RPC_CLIENTS.ranked(["https://rpc-one.example", "https://rpc-two.example"])
+
+        self.assertEqual([client.label for client in ranked], ["rpc-two.example", "rpc-one.example"])
+        self.assertEqual(monitor.RPC_ENDPOINT_CIRCUIT_OPEN.labels("rpc-one.example")._value.get(), 1)
+
+        failing.record(0.1, ok=True)
+        self.assertFalse(failing.is_open(time.time()))
+        self.assertEqual(monitor.RPC_ENDPOINT_CIRCUIT_OPEN.labels("rpc-one.example")._value.get(), 0)
+
+    def test_rpc_clients_on_one_host_get_distinct_labels(self):
+        self.addCleanup(monitor.RPC_CLIENTS.close)
+        urls = ["https://rpc.example/v2/key-one", "https://rpc.example/v2/key-two", "https://other.example"]
+
+        labels = [client.label for client in map(monitor.RPC_CLIENTS.get, urls)]
+
+        self.assertEqual(labels, ["rpc.example", "rpc.example#1", "other.example"])
+        self.assertEqual(monitor.RPC_CLIENTS.get(urls[1]).label, "rpc.example#1")
+
+    def test_circuit_breaker_skips_open_endpoint_and_lets_one_trial_through(self):
+        self.addCleanup(monitor.RPC_CLIENTS.close)
+        failing = monitor.RPC_CLIENTS.get("https://rpc-one.example")
+        for _ in range(monitor.RPC_BREAKER_FAILURES):
+            failing.record(0.1, ok=False)
+        calls = []
+
+        def call_queue_lengths(rpc_url, targets, min_block=None):
+            calls.append(rpc_url)
+            return {TARGET: 250}
+
+        with patch.object(monitor, "call_queue_lengths", side_effect=call_queue_lengths):
+            monitor.fetch_provider_queue_lengths(["https://rpc-one.example"], [TARGET])
+        self.assertEqual(calls, [])
+
+        # Cooldown over: one trial goes through, concurrent callers are still refused
+        failing.open_until = time.time() - 1
+        self.assertTrue(failing.allow_request())
+        self.assertFalse(failing.allow_request())
+        failing.record(0.1, ok=True)
+        self.assertTrue(failing.allow_request())
+
+    def test_call_queue_lengths_batches_targets_on_pooled_connection(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FakeRpcHandler)
+        server.batches = []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(monitor.RPC_CLIENTS.close)
+        url = f"http://127.0.0.1:{server.server_port}"
+        label = f"127.0.0.1:{server.server_port}"
+        targets = [TARGET, monitor.QueueTarget(9, "0x" + "12" * 20, "9@0x" + "12" * 20)]
+
+        for _ in range(3):
+            self.assertEqual(monitor.call_queue_lengths(url, targets), {targets[0]: 740, targets[1]: 90})
+
+        self.assertIs(monitor.RPC_CLIENTS.get(url), monitor.RPC_CLIENTS.get(url))
+        self.assertEqual(server.batches, [["eth_call", "eth_call"]] * 3)
+        self.assertEqual(monitor.RPC_REQUESTS.labels(label, "new")._value.get(), 1)
+        self.assertEqual(monitor.RPC_REQUESTS.labels(label, "reused")._value.get(), 2)
+        self.assertEqual(
+            REGISTRY.get_sample_value(
+                "aztec_provider_rpc_request_duration_seconds_count", {"endpoint": label, "method": "eth_call"},
+            ),
+            3,
+        )
+
+    def test_call_queue_lengths_remembers_answering_signature(self):
+        uint8_selector = monitor.QUEUE_LENGTH_SELECTORS["getProviderQueueLength(uint8)"]
+        client = MagicMock()
+        selectors = []
+
+        def call_batch(transactions):
+            results = []
+            for transaction in transactions:
+                selectors.append(transaction["data"][2:10])
+                if transaction["data"][2:10] != uint8_selector:
+                    results.append(ValueError("execution reverted"))
+                else:
+                    results.append((250).to_bytes(32, byteorder="big"))
+            return results
+
+        client.call_batch.side_effect = call_batch
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = Path(tmp_dir) / "queue-signatures.json"
+            with patch.object(monitor, "SIGNATURE_CACHE", monitor.SignatureCache(cache_path)), \
+                    patch.object(monitor.RPC_CLIENTS, "get", return_value=client):
+                for _ in range(2):
+                    self.assertEqual(monitor.call_queue_lengths("https://rpc.example", [TARGET]), {TARGET: 250})
+
+            restarted = monitor.SignatureCache(cache_path)
+
+        self.assertEqual(len(selectors), 5)
+        self.assertEqual(selectors[-1], uint8_selector)
+        self.assertEqual(
+            restarted.ordered(monitor.PROVIDER_QUEUE_CONTRACT_ADDRESS)[0],
+            "getProviderQueueLength(uint8)",
+        )
+
+    def test_call_queue_lengths_counts_outcomes_per_signature(self):
+        uint256, uint32 = monitor.QUEUE_LENGTH_SIGNATURES[:2]
+        client = MagicMock(label="outcomes.example")
+        client.call_batch.side_effect = [
+            [ValueError("execution reverted")],
+            [(250).to_bytes(32, byteorder="big")],
+            monitor.requests.Timeout("read timed out"),
+        ]
+
+        def count(signature, outcome):
+            return monitor.PROVIDER_QUEUE_CALLS.labels("outcomes.example", signature, outcome)._value.get()
+
+        with patch.object(monitor, "SIGNATURE_CACHE", monitor.SignatureCache()), \
+                patch.object(monitor.RPC_CLIENTS, "get", return_value=client):
+            self.assertEqual(monitor.call_queue_lengths("https://outcomes.example", [TARGET]), {TARGET: 250})
+            with self.assertRaises(monitor.requests.Timeout):
+                monitor.call_queue_lengths("https://outcomes.example", [TARGET])
+
+        self.assertEqual(count(uint256, "revert"), 1)
+        self.assertEqual(count(uint32, "success"), 1)
+        self.assertEqual(count(uint32, "timeout"), 1)
+
+    def test_queue_history_forecasts_depletion_across_restarts(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "queue-history.json"
+            history = monitor.QueueHistory(path, size=4)
+            for timestamp, length in ((0, 500), (3600, 100), (7200, 90), (7300, 200), (10800, 180)):
+                history.record("74", timestamp, length)
+            history.save()
+
+            forecast = monitor.QueueHistory(path, size=4).forecast("74")
+
+        # The first sample fell out of the ring buffer and the top-up does not count as consumption
+        self.assertAlmostEqual(forecast.consumption_rate, 30 / 7200)
+        self.assertAlmostEqual(forecast.seconds_until_empty, 180 / (30 / 7200))
+        self.assertIsNone(monitor.QueueHistory().forecast("74"))
+
+    def test_registry_log_watcher_reports_touched_providers(self):
+        def topic(value):
+            return "0x" + value.to_bytes(32, byteorder="big").hex()
+
+        registry = monitor.PROVIDER_QUEUE_CONTRACT_ADDRESS.lower()
+        heads = iter(["0x64", "0x1f4"])
+        ranges = []
+
+        def request(method, params):
+            if method == "eth_blockNumber":
+                return next(heads)
+            ranges.append((params[0]["fromBlock"], params[0]["toBlock"]))
+            if len(ranges) == 1:
+                return [{"address": registry, "topics": [topic(1), topic(99)]}]
+            return [
+                {"address": registry, "topics": [topic(1), topic(74), topic(3)]},
+                {"address": "0x" + "12" * 20, "topics": [topic(1), topic(74)]},
+            ]
+
+        client = MagicMock(label="rpc.example")
+        client.hedge_delay.return_value = 1.0
+        client.request.side_effect = request
+        watcher = monitor.RegistryLogWatcher([TARGET])
+
+        with patch.object(monitor, "LOG_MAX_BLOCK_RANGE", 300), \
+                patch.object(monitor.RPC_CLIENTS, "ranked", return_value=[client]):
+            self.assertEqual(watcher.poll(["https://rpc.example"]), [])
+            self.assertEqual(watcher.poll(["https://rpc.example"]), [TARGET])
+
+        self.assertEqual(ranges, [("0x65", "0x190"), ("0x191", "0x1f4")])
+        self.assertEqual(watcher.checkpoint, 500)
+
+    def test_registry_log_watcher_races_past_hung_rpc(self):
+        self.addCleanup(monitor.RPC_CLIENTS.close)
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def request(client, method, params):
+            if client.url == "https://rpc-one.example":
+                release.wait(5)
+            return "0x1f4"
+
+        watcher = monitor.RegistryLogWatcher([TARGET])
+        started = time.monotonic()
+        with patch.object(monitor, "RPC_HEDGE_MIN_DELAY", 0.05), \
+                patch.object(monitor.RpcClient, "request", autospec=True, side_effect=request):
+            self.assertEqual(watcher.poll(["https://rpc-one.example", "https://rpc-two.example"]), [])
+
+        self.assertEqual(watcher.checkpoint, 500)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertIsNone(monitor.RPC_CLIENTS.get("https://rpc-one.example").web3.provider.exception_retry_configuration)
+
+    def test_queue_index_reads_only_new_tail_and_cross_checks_keystore(self):
+        local = [Account.create(), Account.create()]
+        queued = [local[0].address.lower(), "0x" + "b1" * 20, "0x" + "c1" * 20, local[1].address.lower()]
+        chain = {"first": 1, "last": 4}
+        entry_reads = []
+        selectors = {
+            monitor.function_selector(signature): signature
+            for signature in (
+                monitor.QUEUE_FIRST_INDEX_SIGNATURE, monitor.QUEUE_LAST_INDEX_SIGNATURE, monitor.QUEUE_ENTRY_SIGNATURE,
             )
+        }
 
-        self.assertEqual(value, 250)
-        self.assertEqual(call_queue_length.call_count, 2)
+        def call_batch(transactions):
+            results = []
+            for transaction in transactions:
+                signature = selectors[transaction["data"][2:10]]
+                if signature == monitor.QUEUE_ENTRY_SIGNATURE:
+                    index = int(transaction["data"][74:], 16)
+                    entry_reads.append(index)
+                    results.append(bytes(12) + bytes.fromhex(queued[index - 1][2:]) + bytes(96))
+                else:
+                    bound = chain["first" if signature == monitor.QUEUE_FIRST_INDEX_SIGNATURE else "last"]
+                    results.append(bound.to_bytes(32, byteorder="big"))
+            return results
+
+        client = MagicMock()
+        client.call_batch.side_effect = call_batch
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(Path(tmp_dir) / "sequencers.json", "w") as f:
+                json.dump({"validators": [{"attester": {"eth": account.key.hex()}} for account in local]}, f)
+
+            with patch.object(monitor, "KEYSTORE", monitor.KeystoreIndex(tmp_dir)), \
+                    patch.object(monitor, "QUEUE_INDEX", monitor.QueueIndex(Path(tmp_dir) / "queue-index.json")), \
+                    patch.object(monitor.RPC_CLIENTS, "ranked", return_value=[client]):
+                monitor.refresh_queue_index(["https://rpc.example"], [TARGET])
+                self.assertEqual(entry_reads, [1, 2, 3])
+
+                # One key consumed from the front, one added at the tail
+                chain.update(first=2, last=5)
+                monitor.refresh_queue_index(["https://rpc.example"], [TARGET])
+                restarted = monitor.QueueIndex(Path(tmp_dir) / "queue-index.json")
+
+        self.assertEqual(entry_reads, [1, 2, 3, 4])
+        self.assertEqual(restarted.attesters("74"), queued[1:])
+        self.assertEqual(monitor.PROVIDER_QUEUE_INDEXED_KEYS.labels("74")._value.get(), 3)
+        self.assertEqual(monitor.PROVIDER_QUEUE_KEYS_WITHOUT_LOCAL_KEY.labels("74")._value.get(), 2)
+        self.assertEqual(monitor.PROVIDER_QUEUE_LOCAL_KEYS_NOT_QUEUED.labels("74")._value.get(), 1)
 
     def test_run_check_sets_success_metrics(self):
-        with patch.object(monitor, "fetch_provider_queue_length", return_value=250):
+        with patch.object(monitor, "fetch_provider_queue_lengths", return_value={TARGET: 250}):
             self.assertTrue(monitor.run_check())
 
         self.assertEqual(
@@ -72,8 +410,28 @@ class ProviderKeyMonitorTests(unittest.TestCase):
             1,
         )
 
+    def test_run_check_records_history_only_on_scheduled_poll(self):
+        history = monitor.QueueHistory()
+        with patch.object(monitor, "QUEUE_HISTORY", history), \
+                patch.object(monitor, "fetch_provider_queue_lengths", return_value={TARGET: 250}):
+            monitor.run_check([TARGET])
+            self.assertEqual(history._samples, {})
+
+            monitor.run_check()
+        self.assertEqual([length for _, length in history._samples["74"]], [250])
+        self.assertEqual(monitor.PROVIDER_QUEUE_LENGTH.labels("74")._value.get(), 250)
+
+    def test_run_check_times_only_scheduled_full_check(self):
+        monitor.PROVIDER_QUEUE_CHECK_DURATION.set(-1)
+        with patch.object(monitor, "fetch_provider_queue_lengths", return_value={TARGET: 250}):
+            monitor.run_check([TARGET])
+            self.assertEqual(monitor.PROVIDER_QUEUE_CHECK_DURATION._value.get(), -1)
+
+            monitor.run_check()
+        self.assertGreaterEqual(monitor.PROVIDER_QUEUE_CHECK_DURATION._value.get(), 0)
+
     def test_run_check_sets_failure_metric(self):
-        with patch.object(monitor, "fetch_provider_queue_length", side_effect=RuntimeError("boom")):
+        with patch.object(monitor, "fetch_provider_queue_lengths", return_value={TARGET: RuntimeError("boom")}):
             self.assertFalse(monitor.run_check())
 
         self.assertEqual(
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the slash monitor.
+
+Starts a stand-in L1 JSON-RPC node in a child process that serves the
+Tally, Slasher, Rollup and Multicall3 ABIs from monitor.py out of
+synthetic chain state, then drives SlashingMonitor.poll() end to end
+against it. Each poll advances the fake chain by one block and one slot
+and casts a vote in the current round, so later polls exercise the
+steady-state path (log-driven refresh, detail cache) rather than
+repeating the cold first poll.
+
+Reports wall time, JSON-RPC requests and eth_calls per poll (Multicall3
+inner calls counted individually) and peak traced memory.
+
+Usage:
+    python bench_monitor.py --lifetime 64 --committee-size 2048 --latency-ms 20
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
+from eth_utils.abi import function_abi_to_4byte_selector, get_abi_input_types, get_abi_output_types
+from web3 import Web3
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import monitor
+
+CHAIN_ID = 31337
+SLASH_AMOUNT = 10 ** 21
+
+
+# ---------------------------------------------------------------------------
+# Fake chain
+# ---------------------------------------------------------------------------
+
+
+class FakeChain:
+    """Synthetic Tally/Slasher/Rollup state sized by the benchmark arguments."""
+
+    def __init__(self, args: argparse.Namespace):
+        self.quorum = args.quorum
+        self.round_size = args.round_size
+        self.execution_delay = args.execution_delay
+        self.lifetime = args.lifetime
+        self.committees = args.committees
+        self.committee_size = args.committee_size
+        self.slashed_per_committee = args.slashed_per_committee
+        self.quorum_ratio = args.quorum_ratio
+        self.target_every = args.target_every
+        self.our_address = args.our_address
+        self.seed = args.seed
+
+        self.block = 1_000_000
+        self.current_round = self.lifetime + 10
+        self.slot = self.current_round * self.round_size
+        self.rounds: dict[int, list] = {}
+        self.committee_cache: dict[int, list[list[str]]] = {}
+        self.logs: list[dict] = []
+        self.lock = threading.Lock()
+
+    def round_state(self, round_num: int) -> list:
+        """[is_executed, vote_count] for a round, generated on first use."""
+        state = self.rounds.get(round_num)
+        if state is None:
+            rng = random.Random(f"{self.seed}:round:{round_num}")
+            closed = round_num < self.current_round - self.execution_delay
+            has_quorum = rng.random() < self.quorum_ratio
+            vote_count = self.quorum + rng.randrange(self.quorum) if has_quorum else rng.randrange(self.quorum)
+            is_executed = has_quorum and closed and round_num < self.current_round - self.execution_delay - 1
+            state = self.rounds[round_num] = [is_executed, vote_count]
+        return state
+
+    def slash_target_committees(self, round_num: int) -> list[list[str]]:
+        committees = self.committee_cache.get(round_num)
+        if committees is None:
+            rng = random.Random(f"{self.seed}:committees:{round_num}")
+            committees = [
+                ["0x" + rng.randbytes(20).hex() for _ in range(self.committee_size)]
+                for _ in range(self.committees)
+            ]
+            if committees and self.target_every and round_num % self.target_every == 0:
+                committees[0][0] = self.our_address
+            self.committee_cache[round_num] = committees
+        return committees
+
+    def tally(self, round_num: int) -> list[tuple[str, int]]:
+        if self.round_state(round_num)[1] < self.quorum:
+            return []
+        return [
+            (addr, SLASH_AMOUNT)
+            for committee in self.slash_target_committees(round_num)
+            for addr in committee[:self.slashed_per_committee]
+        ]
+
+    def advance(self):
+        """Mine one block in a new slot and cast one vote in the current round."""
+        with self.lock:
+            self.block += 1
+            self.slot += 1
+            self.current_round = self.slot // self.round_size
+            self.round_state(self.current_round)[1] += 1
+            self.logs.append({
+                "address": monitor.CONTRACTS["mainnet"]["tally"],
+                "topics": [
+                    monitor.TALLY_EVENT_TOPICS[0],
+                    "0x" + self.current_round.to_bytes(32, "big").hex(),
+                    "0x" + bytes(32).hex(),
+                ],
+                "data": "0x",
+                "blockNumber": hex(self.block),
+                "blockHash": "0x" + self.block.to_bytes(32, "big").hex(),
+                "transactionHash": "0x" + (self.block + 1).to_bytes(32, "big").hex(),
+                "transactionIndex": "0x0",
+                "logIndex": "0x0",
+                "removed": False,
+            })
+
+    # Contract functions, by ABI name ------------------------------------
+
+    def getCurrentRound(self):
+        return self.current_round
+
+    def getRound(self, round_num):
+        return tuple(self.round_state(round_num))
+
+    def getSlashTargetCommittees(self, round_num):
+        return self.slash_target_committees(round_num)
+
+    def getTally(self, round_num, _committees):
+        return self.tally(round_num)
+
+    def getPayloadAddress(self, round_num, _actions):
+        return "0x" + Web3.keccak(round_num.to_bytes(32, "big"))[-20:].hex()
+
+    def QUORUM(self):
+        return self.quorum
+
+    def ROUND_SIZE(self):
+        return self.round_size
+
+    def ROUND_SIZE_IN_EPOCHS(self):
+        return self.round_size // 32 or 1
+
+    def EXECUTION_DELAY_IN_ROUNDS(self):
+        return self.execution_delay
+
+    def LIFETIME_IN_ROUNDS(self):
+        return self.lifetime
+
+    def SLASH_OFFSET_IN_ROUNDS(self):
+        return 2
+
+    def isSlashingEnabled(self):
+        return True
+
+    def slashingDisabledUntil(self):
+        return 0
+
+    def vetoedPayloads(self, _payload):
+        return False
+
+    def getCurrentSlot(self):
+        return self.slot
+
+    def getCurrentEpoch(self):
+        return self.slot // 32
+
+    def getSlotDuration(self):
+        return 36
+
+    def getEpochDuration(self):
+        return 32
+
+    def getActiveAttesterCount(self):
+        return self.committees * self.committee_size
+
+
+# ---------------------------------------------------------------------------
+# Fake JSON-RPC node
+# ---------------------------------------------------------------------------
+
+
+FUNCTIONS = {
+    function_abi_to_4byte_selector(abi): (abi["name"], get_abi_input_types(abi), get_abi_output_types(abi))
+    for abi in monitor.TALLY_ABI + monitor.SLASHER_ABI + monitor.ROLLUP_ABI + monitor.MULTICALL3_ABI
+    if abi["type"] == "function"
+}
+
+# The fake chain only looks at the round argument of these
+ROUND_ONLY_FUNCTIONS = {"getTally", "getPayloadAddress"}
+
+
+class FakeNode:
+    """Answers JSON-RPC requests from a FakeChain and counts what was asked."""
+
+    def __init__(self, chain: FakeChain, latency: float):
+        self.chain = chain
+        self.latency = latency
+        self.stats = Counter()
+        self.stats_lock = threading.Lock()
+
+    def count(self, key: str, amount: int = 1):
+        with self.stats_lock:
+            self.stats[key] += amount
+
+    def eth_call(self, data: bytes) -> bytes:
+        name, input_types, output_types = FUNCTIONS[data[:4]]
+        if name in ROUND_ONLY_FUNCTIONS:
+            # Skip decoding the committee/action arrays so node-side CPU stays
+            # out of the monitor's wall time
+            args = (int.from_bytes(data[4:36], "big"), None)
+        else:
+            args = abi_decode(input_types, data[4:])
+        if name == "aggregate3":
+            results = []
+            for _target, _allow_failure, call_data in args[0]:
+                try:
+                    results.append((True, self.eth_call(bytes(call_data))))
+                except Exception:
+                    results.append((False, b""))
+            value = (results,)
+        else:
+            self.count(f"eth_call:{name}")
+            with self.chain.lock:
+                value = getattr(self.chain, name)(*args)
+            value = value if isinstance(value, tuple) else (value,)
+        self.count("eth_call")
+        return abi_encode(output_types, value)
+
+    def handle(self, request: dict) -> dict:
+        method, params = request["method"], request.get("params") or []
+        if not method.startswith("bench_"):
+            self.count(f"rpc:{method}")
+        if method == "eth_chainId":
+            result = hex(CHAIN_ID)
+        elif method == "eth_blockNumber":
+            result = hex(self.chain.block)
+        elif method == "eth_call":
+            result = "0x" + self.eth_call(bytes.fromhex(params[0]["data"][2:])).hex()
+        elif method == "eth_getLogs":
+            from_block = int(params[0]["fromBlock"], 16)
+            to_block = int(params[0]["toBlock"], 16)
+            with self.chain.lock:
+                result = [log for log in self.chain.logs if from_block <= int(log["blockNumber"], 16) <= to_block]
+        elif method == "web3_clientVersion":
+            result = "bench-fake-node"
+        elif method == "bench_advance":
+            self.chain.advance()
+            result = self.chain.block
+        elif method == "bench_stats":
+            with self.stats_lock:
+                result, self.stats = dict(self.stats), Counter()
+        else:
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": {"code": -32601, "message": method}}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+
+def serve(args: argparse.Namespace, port_pipe):
+    node = FakeNode(FakeChain(args), args.latency_ms / 1000)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            measured = not body["method"].startswith("bench_")
+            if measured and node.latency:
+                time.sleep(node.latency)
+            response = json.dumps(node.handle(body)).encode()
+            if measured:
+                node.count("requests")
+                node.count("response_bytes", len(response))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+
+        def log_message(self, *_):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    port_pipe.send(server.server_address[1])
+    server.serve_forever()
+
+
+def control(url: str, method: str):
+    """Call one of the fake node's bench_* methods outside the monitor's provider."""
+    request = urllib.request.Request(
+        url,
+        data=json.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": []}).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())["result"]
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+def run(args: argparse.Namespace) -> list[dict]:
+    parent_pipe, child_pipe = multiprocessing.Pipe()
+    node = multiprocessing.Process(target=serve, args=(args, child_pipe), daemon=True)
+    node.start()
+    url = f"http://127.0.0.1:{parent_pipe.recv()}"
+
+    try:
+        w3 = Web3(monitor.FailoverHTTPProvider([url], "mainnet"))
+        executor = ThreadPoolExecutor(max_workers=monitor.DETAIL_WORKERS, thread_name_prefix="round")
+        slashing_monitor = monitor.SlashingMonitor(w3, "mainnet", [args.our_address], None, executor)
+        if args.no_multicall:
+            slashing_monitor.multicall = None
+        slashing_monitor.load_constants()
+        control(url, "bench_stats")
+
+        if args.trace_memory:
+            tracemalloc.start()
+
+        results = []
+        for poll in range(args.polls):
+            control(url, "bench_advance")
+            if args.trace_memory:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+
+            started = time.perf_counter()
+            slashing_monitor.poll()
+            wall = time.perf_counter() - started
+
+            stats = control(url, "bench_stats")
+            results.append({
+                "poll": poll,
+                "wall_ms": round(wall * 1000, 2),
+                "requests": stats.get("requests", 0),
+                "eth_calls": stats.get("eth_call", 0),
+                "response_bytes": stats.get("response_bytes", 0),
+                "peak_kib": (
+                    round((tracemalloc.get_traced_memory()[1] - baseline) / 1024, 1)
+                    if args.trace_memory else None
+                ),
+                "calls": {key: value for key, value in sorted(stats.items()) if ":" in key},
+            })
+
+        executor.shutdown()
+        return results
+    finally:
+        node.terminate()
+        node.join()
+
+
+def report(args: argparse.Namespace, results: list[dict]):
+    print(
+        f"lifetime={args.lifetime} execution_delay={args.execution_delay} "
+        f"committees={args.committees}x{args.committee_size} slashed/committee={args.slashed_per_committee} "
+        f"latency={args.latency_ms}ms multicall={'off' if args.no_multicall else 'on'}",
+    )
+    print(f"{'poll':>4} {'wall ms':>10} {'requests':>9} {'eth_calls':>9} {'resp KiB':>9} {'peak KiB':>9}")
+    for result in results:
+        peak = f"{result['peak_kib']:>9.1f}" if result["peak_kib"] is not None else f"{'-':>9}"
+        print(
+            f"{result['poll']:>4} {result['wall_ms']:>10.2f} {result['requests']:>9} "
+            f"{result['eth_calls']:>9} {result['response_bytes'] / 1024:>9.1f} {peak}",
+        )
+
+    steady = results[1:]
+    if steady:
+        print(
+            f"cold poll {results[0]['wall_ms']:.2f} ms, "
+            f"steady median {statistics.median(r['wall_ms'] for r in steady):.2f} ms, "
+            f"steady requests/poll {statistics.mean(r['requests'] for r in steady):.1f}",
+        )
+    if args.verbose:
+        for result in results:
+            print(f"poll {result['poll']}: {result['calls']}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark SlashingMonitor.poll() against a fake L1 node")
+    parser.add_argument("--polls", type=int, default=10, help="Polls to run; the first one is cold")
+    parser.add_argument("--lifetime", type=int, default=32, help="LIFETIME_IN_ROUNDS of the fake Tally")
+    parser.add_argument("--execution-delay", type=int, default=2, help="EXECUTION_DELAY_IN_ROUNDS")
+    parser.add_argument("--round-size", type=int, default=192, help="ROUND_SIZE in slots")
+    parser.add_argument("--quorum", type=int, default=100, help="QUORUM of the fake Tally")
+    parser.add_argument("--quorum-ratio", type=float, default=0.5, help="Share of rounds that reach quorum")
+    parser.add_argument("--committees", type=int, default=4, help="Slash target committees per round")
+    parser.add_argument("--committee-size", type=int, default=48, help="Attesters per committee")
+    parser.add_argument("--slashed-per-committee", type=int, default=8, help="Tally actions per committee")
+    parser.add_argument("--target-every", type=int, default=5, help="Target our validator every Nth round; 0 disables")
+    parser.add_argument("--our-address", default="0x" + "ab" * 20, help="Local validator address")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Latency injected into every RPC request")
+    parser.add_argument("--no-multicall", action="store_true", help="Disable Multicall3 batching")
+    parser.add_argument("--no-trace-memory", dest="trace_memory", action="store_false",
+                        help="Skip tracemalloc, which slows polls down")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the synthetic chain state")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Print per-function call counts for each poll")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        report(args, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,16 +8,35 @@ Exposes Prometheus metrics for Grafana dashboards and alerting.
 Based on the logic from sekuba/slashmon (slashveto.me).
 """
 
+import argparse
+import hashlib
 import json
 import logging
+import math
+import multiprocessing
 import os
+import sqlite3
 import sys
+import threading
 import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
 
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
 from eth_account import Account
-from prometheus_client import Counter, Gauge, start_http_server
+from eth_utils.abi import function_abi_to_4byte_selector, get_abi_input_types, get_abi_output_types
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram, start_http_server
+from prometheus_client.core import GaugeMetricFamily
 from web3 import Web3
+from web3.providers.base import JSONBaseProvider
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -25,10 +44,47 @@ from web3 import Web3
 
 L1_RPC_URL = os.getenv("L1_RPC_URL", "")
 KEYSTORE_PATH = os.getenv("KEYSTORE_PATH", "/keystore")
+# Optional directory for the round history store and address cache; empty disables persistence
+DATA_PATH = os.getenv("DATA_PATH", "")
+# Attester keys are derived in a process pool once a keystore has this many uncached keys
+KEY_DERIVATION_WORKERS = int(os.getenv("KEY_DERIVATION_WORKERS", str(os.cpu_count() or 1)))
+KEY_DERIVATION_PARALLEL_MIN = int(os.getenv("KEY_DERIVATION_PARALLEL_MIN", "64"))
 POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "900"))
-NETWORK = os.getenv("NETWORK", "mainnet").lower()
+# Lower bound for polls scheduled ahead of a round state transition
+MIN_POLL_INTERVAL = int(os.getenv("MIN_POLL_INTERVAL", "60"))
+# Seconds between Tally log checks between polls; 0 disables event-driven refresh
+LOG_POLL_INTERVAL = int(os.getenv("LOG_POLL_INTERVAL", "12"))
+LOG_MAX_BLOCK_RANGE = int(os.getenv("LOG_MAX_BLOCK_RANGE", "5000"))
+# Comma-separated networks watched by this process, each with its own RPC and keystore
+NETWORKS = [network.strip().lower() for network in os.getenv("NETWORK", "mainnet").split(",") if network.strip()]
 METRICS_PORT = int(os.getenv("METRICS_PORT", "9101"))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+RPC_TIMEOUT = int(os.getenv("RPC_TIMEOUT", "30"))
+
+# Endpoint scoring and request hedging across the configured L1 RPC URLs
+RPC_EWMA_ALPHA = float(os.getenv("RPC_EWMA_ALPHA", "0.3"))
+RPC_ERROR_PENALTY = float(os.getenv("RPC_ERROR_PENALTY", "10"))
+RPC_HEDGE_ENABLED = os.getenv("RPC_HEDGE_ENABLED", "true").lower() == "true"
+RPC_HEDGE_MIN_DELAY = float(os.getenv("RPC_HEDGE_MIN_DELAY", "0.25"))
+RPC_HEDGE_METHODS = {"eth_call", "eth_blockNumber"}
+
+# Multicall3 batching for global reads and the getRound sweep
+MULTICALL_ENABLED = os.getenv("MULTICALL_ENABLED", "true").lower() == "true"
+MULTICALL3_ADDRESS = os.getenv("MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11")
+MULTICALL_BATCH_SIZE = int(os.getenv("MULTICALL_BATCH_SIZE", "100"))
+
+# Round evaluation runs on a worker pool; in-flight RPC calls are capped separately
+DETAIL_WORKERS = int(os.getenv("DETAIL_WORKERS", "8"))
+RPC_MAX_CONCURRENCY = int(os.getenv("RPC_MAX_CONCURRENCY", "4"))
+
+# Rounds read per backfill chunk; progress is checkpointed after each chunk
+BACKFILL_CHUNK_SIZE = int(os.getenv("BACKFILL_CHUNK_SIZE", "100"))
+
+# Maximum number of finalized rounds whose details are kept in memory
+DETAIL_CACHE_SIZE = int(os.getenv("DETAIL_CACHE_SIZE", "256"))
+# Backoff bounds for reading contract constants while the L1 RPC is unreachable
+CONSTANTS_RETRY_MIN = 5
+CONSTANTS_RETRY_MAX = int(os.getenv("CONSTANTS_RETRY_MAX", "300"))
 
 # Contract addresses per network
 CONTRACTS = {
@@ -103,6 +159,25 @@ ROLLUP_ABI = json.loads("""[
      "inputs":[],"outputs":[{"name":"","type":"uint256"}]}
 ]""")
 
+# Tally events that change a round's vote count or executed flag; the round
+# number is the first indexed topic of both
+TALLY_EVENT_TOPICS = [
+    Web3.to_hex(Web3.keccak(text="VoteCast(uint256,uint256,address)")),
+    Web3.to_hex(Web3.keccak(text="RoundExecuted(uint256,uint256)")),
+]
+
+# Size of one ABI-encoded (address validator, uint256 slashAmount) action
+ACTION_SIZE = 64
+
+MULTICALL3_ABI = json.loads("""[
+    {"type":"function","name":"aggregate3","stateMutability":"payable",
+     "inputs":[{"name":"calls","type":"tuple[]","components":[
+         {"name":"target","type":"address"},{"name":"allowFailure","type":"bool"},
+         {"name":"callData","type":"bytes"}]}],
+     "outputs":[{"name":"returnData","type":"tuple[]","components":[
+         {"name":"success","type":"bool"},{"name":"returnData","type":"bytes"}]}]}
+]""")
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -114,6 +189,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class NetworkLogAdapter(logging.LoggerAdapter):
+    """Prefixes log messages with the network they concern."""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['network']}] {msg}", kwargs
+
+
 # ---------------------------------------------------------------------------
 # Prometheus metrics
 # ---------------------------------------------------------------------------
@@ -122,93 +205,108 @@ logger = logging.getLogger(__name__)
 SLASHING_ENABLED = Gauge(
     "aztec_slashing_enabled",
     "Whether slashing is globally enabled (1=yes, 0=no)",
+    ["network"],
 )
 SLASHING_DISABLED_UNTIL = Gauge(
     "aztec_slashing_disabled_until_timestamp",
     "Unix timestamp when slashing halt ends (0 if enabled)",
+    ["network"],
 )
 CURRENT_ROUND = Gauge(
     "aztec_slashing_current_round",
     "Current slashing round number",
+    ["network"],
 )
 CURRENT_SLOT = Gauge(
     "aztec_slashing_current_slot",
     "Current Aztec slot number",
+    ["network"],
 )
 QUORUM_THRESHOLD = Gauge(
     "aztec_slashing_quorum_threshold",
     "Number of votes needed for quorum",
+    ["network"],
 )
 ACTIVE_ATTESTER_COUNT = Gauge(
     "aztec_slashing_active_attester_count",
     "Number of active attesters in the network",
+    ["network"],
 )
 
-# Per-round metrics
-ROUND_VOTE_COUNT = Gauge(
-    "aztec_slashing_round_vote_count",
-    "Vote count for a slashing round",
-    ["round"],
-)
-ROUND_HAS_QUORUM = Gauge(
-    "aztec_slashing_round_has_quorum",
-    "Whether a round has reached quorum (1=yes, 0=no)",
-    ["round"],
-)
-ROUND_IS_EXECUTED = Gauge(
-    "aztec_slashing_round_is_executed",
-    "Whether a round has been executed (1=yes, 0=no)",
-    ["round"],
-)
-ROUND_IS_VETOED = Gauge(
-    "aztec_slashing_round_is_vetoed",
-    "Whether a round has been vetoed (1=yes, 0=no)",
-    ["round"],
-)
-ROUND_SECONDS_UNTIL_EXECUTABLE = Gauge(
-    "aztec_slashing_round_seconds_until_executable",
-    "Seconds until a round becomes executable",
-    ["round"],
-)
-ROUND_SECONDS_UNTIL_EXPIRES = Gauge(
-    "aztec_slashing_round_seconds_until_expires",
-    "Seconds until a round expires",
-    ["round"],
-)
-ROUND_STATUS = Gauge(
-    "aztec_slashing_round_status",
-    "Round status encoded as int: 0=expired, 1=voting, 2=quorum-reached, 3=in-veto-window, 4=executable, 5=executed",
-    ["round"],
-)
-
-# Our-validator-specific metrics
-OUR_VALIDATOR_TARGETED = Gauge(
-    "aztec_slashing_our_validator_targeted",
-    "Whether our validator is targeted in a round (1=yes, 0=no)",
-    ["round", "validator"],
-)
-OUR_VALIDATOR_SLASH_AMOUNT = Gauge(
-    "aztec_slashing_our_validator_slash_amount",
-    "Slash amount targeting our validator in a round (wei)",
-    ["round", "validator"],
-)
-OUR_VALIDATOR_TARGETED_TOTAL = Gauge(
-    "aztec_slashing_our_validator_targeted_rounds_total",
-    "Total number of active rounds targeting any of our validators",
-)
+# Per-round and our-validator metrics are generated at scrape time by
+# RoundMetricsCollector (see below) from the snapshot published by each poll
 
 # Poll health
 POLL_ERRORS = Counter(
     "aztec_slashing_poll_errors_total",
     "Total number of poll errors",
+    ["network"],
 )
 POLL_SUCCESS = Counter(
     "aztec_slashing_poll_success_total",
     "Total number of successful polls",
+    ["network"],
 )
 LAST_POLL_TIMESTAMP = Gauge(
     "aztec_slashing_last_poll_timestamp",
     "Unix timestamp of the last successful poll",
+    ["network"],
+)
+POLL_DURATION = Histogram(
+    "aztec_slashing_poll_duration_seconds",
+    "Wall time of a whole poll cycle",
+    ["network"],
+    buckets=(0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600),
+)
+LAST_POLL_BLOCK = Gauge(
+    "aztec_slashing_last_poll_block",
+    "L1 block number the last successful poll was pinned to",
+    ["network"],
+)
+NEXT_POLL_INTERVAL = Gauge(
+    "aztec_slashing_next_poll_interval_seconds",
+    "Seconds the scheduler waits before the next poll",
+    ["network"],
+)
+
+# RPC calls made through SlashingMonitor, by contract function or RPC method
+RPC_CALL_DURATION = Histogram(
+    "aztec_slashing_rpc_call_duration_seconds",
+    "Latency of RPC calls by contract function or RPC method",
+    ["network", "function"],
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+RPC_CALLS = Counter(
+    "aztec_slashing_rpc_calls_total",
+    "Total number of RPC calls by contract function or RPC method and outcome",
+    ["network", "function", "outcome"],
+)
+RPC_RESPONSE_BYTES = Counter(
+    "aztec_slashing_rpc_response_bytes_total",
+    "Total raw bytes of return data received from contract calls",
+    ["network", "function"],
+)
+MULTICALL_INNER_CALLS = Counter(
+    "aztec_slashing_multicall_inner_calls_total",
+    "Total number of calls batched into Multicall3 aggregate3 by function and outcome",
+    ["network", "function", "outcome"],
+)
+
+# RPC endpoint health
+RPC_ENDPOINT_LATENCY = Gauge(
+    "aztec_slashing_rpc_endpoint_latency_seconds",
+    "EWMA request latency of an L1 RPC endpoint",
+    ["network", "endpoint"],
+)
+RPC_ENDPOINT_ERROR_RATE = Gauge(
+    "aztec_slashing_rpc_endpoint_error_rate",
+    "EWMA request error rate of an L1 RPC endpoint (0-1)",
+    ["network", "endpoint"],
+)
+RPC_HEDGED_REQUESTS = Counter(
+    "aztec_slashing_rpc_hedged_requests_total",
+    "Total number of duplicate requests sent to a second L1 RPC endpoint",
+    ["network"],
 )
 
 # Status string to int mapping for Prometheus
@@ -221,21 +319,147 @@ STATUS_MAP = {
     "executed": 5,
 }
 
+# Once voting has closed, a round's committees, tally and payload are final
+FINAL_DETAIL_STATUSES = {"expired", "in-veto-window", "executable", "executed"}
+
+# A payload can still be vetoed until the round executes or expires
+VETO_OPEN_STATUSES = {"quorum-reached", "in-veto-window", "executable"}
+
 # ---------------------------------------------------------------------------
 # Keystore reader
 # ---------------------------------------------------------------------------
 
 
-def load_validator_addresses(keystore_path: str) -> list[str]:
+KEYSTORE_FILES = ("sequencers.json", "sequencer.json")
+
+
+def derive_attester_address(eth_key: str) -> str | None:
+    """Derive the lowercase address of an attester private key, or None if invalid."""
+    try:
+        return Account.from_key(eth_key).address.lower()
+    except Exception:
+        return None
+
+
+def key_fingerprint(eth_key: str) -> str:
+    """Cache key for a private key; the key itself is never written to disk."""
+    normalized = eth_key.lower().removeprefix("0x")
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def write_json_atomic(path: Path, data: Any):
+    """Write data as JSON to a temporary file and move it over path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    tmp_path.replace(path)
+
+
+class AddressCache:
+    """
+    On-disk map from attester key fingerprint to derived address. Shared by
+    the keystores of every monitored network; only fingerprints present in
+    some keystore file's latest scan are kept.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._addresses: dict[str, str] = {}
+        # Fingerprints in the latest scan of each keystore file
+        self._live: dict[str, set[str]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        if path is not None and path.exists():
+            try:
+                with open(path) as f:
+                    self._addresses = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning("Failed to read address cache %s: %s", path, e)
+
+    def get(self, fingerprint: str) -> str | None:
+        with self._lock:
+            return self._addresses.get(fingerprint)
+
+    def put(self, fingerprint: str, address: str):
+        with self._lock:
+            self._addresses[fingerprint] = address
+            self._dirty = True
+
+    def save(self, source: str, fingerprints: Iterable[str]):
+        """
+        Record the fingerprints of source's latest scan, drop keys no
+        keystore file holds any more and write the cache.
+        """
+        with self._lock:
+            live = set(fingerprints)
+            previous = self._live.get(source, set())
+            self._live[source] = live
+            kept = set().union(*self._live.values())
+            for fingerprint in previous - kept:
+                self._addresses.pop(fingerprint, None)
+            if live != previous:
+                self._dirty = True
+
+            if self.path is None or not self._dirty:
+                return
+            try:
+                # Entries loaded from disk that no scanned file claims yet
+                # stay in memory for the other keystores' first scan
+                write_json_atomic(
+                    self.path, {fp: address for fp, address in self._addresses.items() if fp in kept},
+                )
+                self._dirty = False
+            except IOError as e:
+                logger.warning("Failed to save address cache %s: %s", self.path, e)
+
+
+def derive_addresses(eth_keys: list[str], cache: AddressCache, source: str = "") -> list[str | None]:
+    """
+    Derive addresses for attester keys, serving known keys from the cache.
+    Large batches of uncached keys are derived in a process pool. source
+    names the keystore file the keys came from, for cache pruning.
+    """
+    fingerprints = [key_fingerprint(key) for key in eth_keys]
+    addresses = [cache.get(fp) for fp in fingerprints]
+    missing = [i for i, address in enumerate(addresses) if address is None]
+
+    if len(missing) >= KEY_DERIVATION_PARALLEL_MIN and KEY_DERIVATION_WORKERS > 1:
+        # Spawned workers: forking this multi-threaded process could copy a
+        # lock held by another thread into the child and deadlock it
+        with ProcessPoolExecutor(
+            max_workers=KEY_DERIVATION_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            derived = list(pool.map(
+                derive_attester_address,
+                [eth_keys[i] for i in missing],
+                chunksize=max(1, len(missing) // (KEY_DERIVATION_WORKERS * 4)),
+            ))
+    else:
+        derived = [derive_attester_address(eth_keys[i]) for i in missing]
+
+    for i, address in zip(missing, derived):
+        addresses[i] = address
+        if address is not None:
+            cache.put(fingerprints[i], address)
+
+    cache.save(source, fingerprints)
+    return addresses
+
+
+def load_validator_addresses(keystore_path: str, cache: AddressCache | None = None) -> list[str]:
     """
     Read attester addresses from the keystore.
 
     Tries sequencers.json first (has validator entries with attester keys),
     falls back to sequencer.json.
     """
+    if cache is None:
+        cache = AddressCache()
     addresses = []
 
-    for filename in ("sequencers.json", "sequencer.json"):
+    for filename in KEYSTORE_FILES:
         filepath = Path(keystore_path) / filename
         if not filepath.exists():
             continue
@@ -247,19 +471,20 @@ def load_validator_addresses(keystore_path: str) -> list[str]:
             logger.warning("Failed to read %s: %s", filepath, e)
             continue
 
-        validators = data.get("validators", [])
-        for v in validators:
+        # attester.eth is a private key — derive the public address
+        eth_keys = []
+        for v in data.get("validators", []):
             attester = v.get("attester", {})
-
-            # attester.eth is a private key — derive the public address
             eth_key = attester.get("eth", "") if isinstance(attester, dict) else ""
             if eth_key:
-                try:
-                    account = Account.from_key(eth_key)
-                    addresses.append(account.address.lower())
-                    logger.info("Loaded attester address %s from %s", account.address, filename)
-                except Exception as e:
-                    logger.warning("Failed to derive address from attester key in %s: %s", filename, e)
+                eth_keys.append(eth_key)
+
+        for address in derive_addresses(eth_keys, cache, str(filepath)):
+            if address is None:
+                logger.warning("Failed to derive address from attester key in %s", filename)
+                continue
+            addresses.append(address)
+            logger.info("Loaded attester address %s from %s", Web3.to_checksum_address(address), filename)
 
         if addresses:
             break
@@ -270,16 +495,864 @@ def load_validator_addresses(keystore_path: str) -> list[str]:
     return addresses
 
 
+class KeystoreIndex:
+    """Re-reads attester addresses whenever a keystore file's mtime changes."""
+
+    def __init__(self, keystore_path: str, cache: AddressCache | None = None):
+        self.keystore_path = keystore_path
+        self.cache = cache if cache is not None else AddressCache()
+        self._mtimes: dict[str, float | None] | None = None
+
+    def _current_mtimes(self) -> dict[str, float | None]:
+        mtimes = {}
+        for filename in KEYSTORE_FILES:
+            try:
+                mtimes[filename] = (Path(self.keystore_path) / filename).stat().st_mtime
+            except OSError:
+                mtimes[filename] = None
+        return mtimes
+
+    def refresh(self) -> list[str] | None:
+        """Return the current addresses if the keystore changed since the last call, else None."""
+        mtimes = self._current_mtimes()
+        if mtimes == self._mtimes:
+            return None
+        self._mtimes = mtimes
+        return load_validator_addresses(self.keystore_path, self.cache)
+
+
+# ---------------------------------------------------------------------------
+# RPC client
+# ---------------------------------------------------------------------------
+
+
+def endpoint_labels(urls: list[str]) -> list[str]:
+    """
+    Metric labels for a set of RPC URLs. Only the host is exported, since RPC
+    URLs often embed API keys; an endpoint sharing its host with an earlier
+    one gets its index appended so their series stay apart.
+    """
+    hosts = [urlparse(url).netloc.rsplit("@", 1)[-1] or url for url in urls]
+    return [host if hosts.index(host) == index else f"{host}#{index}" for index, host in enumerate(hosts)]
+
+
+class RpcEndpoint:
+    """One L1 RPC URL with EWMA latency and error-rate statistics."""
+
+    def __init__(self, url: str, network: str, label: str | None = None):
+        self.url = url
+        self.network = network
+        self.label = label or endpoint_labels([url])[0]
+        # No provider-level retries: failover and hedging move on to another
+        # endpoint instead of re-sending to a hung one
+        self.provider = Web3.HTTPProvider(
+            url, request_kwargs={"timeout": RPC_TIMEOUT}, exception_retry_configuration=None,
+        )
+        self.latency_ewma = 0.0
+        self.error_ewma = 0.0
+        self.latencies: deque[float] = deque(maxlen=100)
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def saturated(self) -> bool:
+        """Whether RPC_MAX_CONCURRENCY requests are still waiting on this endpoint."""
+        return self.in_flight >= RPC_MAX_CONCURRENCY
+
+    def score(self) -> float:
+        """Lower is better. Unmeasured endpoints score 0 so they get tried."""
+        return self.latency_ewma + self.error_ewma * RPC_ERROR_PENALTY
+
+    def hedge_delay(self) -> float:
+        """p95 of recent successful request latencies."""
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if len(latencies) < 20:
+            return max(RPC_HEDGE_MIN_DELAY, self.latency_ewma * 2)
+        return max(RPC_HEDGE_MIN_DELAY, latencies[int(len(latencies) * 0.95) - 1])
+
+    def record(self, latency: float, ok: bool):
+        with self._lock:
+            if ok:
+                self.latencies.append(latency)
+                if self.latency_ewma == 0.0:
+                    self.latency_ewma = latency
+                else:
+                    self.latency_ewma += RPC_EWMA_ALPHA * (latency - self.latency_ewma)
+            self.error_ewma += RPC_EWMA_ALPHA * ((0.0 if ok else 1.0) - self.error_ewma)
+
+        RPC_ENDPOINT_LATENCY.labels(network=self.network, endpoint=self.label).set(self.latency_ewma)
+        RPC_ENDPOINT_ERROR_RATE.labels(network=self.network, endpoint=self.label).set(self.error_ewma)
+
+
+class FailoverHTTPProvider(JSONBaseProvider):
+    """
+    web3 provider that spreads requests over several L1 RPC endpoints.
+
+    Each request goes to the endpoint with the best latency/error score and
+    fails over to the next one on transport errors. Read calls that take
+    longer than the endpoint's p95 latency are hedged with a duplicate request
+    to the next-best endpoint; the first successful response wins.
+    """
+
+    def __init__(self, urls: list[str], network: str, **kwargs):
+        super().__init__(**kwargs)
+        if not urls:
+            raise ValueError("at least one RPC URL is required")
+        self.network = network
+        self.endpoints = [RpcEndpoint(url, network, label) for url, label in zip(urls, endpoint_labels(urls))]
+        self._chain_id_response = None
+        pool_size = 2 * RPC_MAX_CONCURRENCY + 2
+        self._hedge_pool = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="rpc")
+        # Free pool threads; a request that finds none is sent without hedging
+        self._hedge_slots = threading.BoundedSemaphore(pool_size)
+
+    def ranked_endpoints(self) -> list[RpcEndpoint]:
+        """Best score first; endpoints with a full set of hung requests go last."""
+        return sorted(self.endpoints, key=lambda endpoint: (endpoint.saturated(), endpoint.score()))
+
+    def make_request(self, method, params):
+        # web3's validation middleware asks for the chain ID before every
+        # eth_call; it cannot change under a configured endpoint set
+        if method == "eth_chainId" and self._chain_id_response is not None:
+            return self._chain_id_response
+        ranked = self.ranked_endpoints()
+        if RPC_HEDGE_ENABLED and method in RPC_HEDGE_METHODS and len(ranked) > 1:
+            response = self._hedged_request(ranked, method, params)
+        else:
+            response = self._failover_request(ranked, method, params)
+        if method == "eth_chainId" and "result" in response:
+            self._chain_id_response = response
+        return response
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return any(endpoint.provider.is_connected() for endpoint in self.endpoints)
+
+    def _send(self, endpoint: RpcEndpoint, method, params, record_once=None):
+        """
+        Send one request and record its outcome against the endpoint, unless
+        record_once was already taken by a hedge counting it as stalled.
+        """
+        with endpoint._lock:
+            endpoint.in_flight += 1
+        started = time.monotonic()
+        ok = False
+        try:
+            response = endpoint.provider.make_request(method, params)
+            ok = True
+            return response
+        finally:
+            with endpoint._lock:
+                endpoint.in_flight -= 1
+            if record_once is None or record_once.acquire(blocking=False):
+                endpoint.record(time.monotonic() - started, ok)
+
+    def _submit(self, endpoint: RpcEndpoint, method, params, record_once=None):
+        """Run _send on the hedge pool, or return None when every pool thread is busy."""
+        if not self._hedge_slots.acquire(blocking=False):
+            return None
+        future = self._hedge_pool.submit(self._send, endpoint, method, params, record_once)
+        future.add_done_callback(lambda _: self._hedge_slots.release())
+        return future
+
+    def _failover_request(self, ranked: list[RpcEndpoint], method, params):
+        last_error: Exception | None = None
+        for endpoint in ranked:
+            try:
+                return self._send(endpoint, method, params)
+            except Exception as e:
+                last_error = e
+                logger.warning("RPC %s failed via %s: %s", method, endpoint.label, e)
+        raise last_error
+
+    def _hedged_request(self, ranked: list[RpcEndpoint], method, params):
+        primary, secondary = ranked[0], ranked[1]
+        if primary.saturated():
+            # Every endpoint is full of hung requests; do not queue more in the pool
+            return self._failover_request(ranked, method, params)
+        delay = primary.hedge_delay()
+        record_once = threading.Lock()
+        first = self._submit(primary, method, params, record_once)
+        if first is None:
+            # The pool is full of hung requests; send this one without hedging
+            return self._failover_request(ranked, method, params)
+        try:
+            return first.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        except Exception as e:
+            logger.warning("RPC %s failed via %s: %s", method, primary.label, e)
+            return self._failover_request(ranked[1:], method, params)
+
+        # Count the stall against the primary now, so the next requests rank
+        # the other endpoints first instead of waiting for it to time out.
+        # The primary's own completion is then not recorded a second time.
+        if record_once.acquire(blocking=False):
+            primary.record(delay, False)
+        hedge = None if secondary.saturated() else self._submit(secondary, method, params)
+        if hedge is None:
+            # No room for a duplicate request: wait for the primary alone
+            try:
+                return first.result()
+            except Exception as e:
+                logger.warning("RPC %s failed via %s: %s", method, primary.label, e)
+                return self._failover_request(ranked[1:], method, params)
+        RPC_HEDGED_REQUESTS.labels(self.network).inc()
+        pending = {first, hedge}
+        last_error: Exception | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                last_error = future.exception()
+
+        if len(ranked) > 2:
+            return self._failover_request(ranked[2:], method, params)
+        raise last_error
+
+
+# ---------------------------------------------------------------------------
+# Multicall3 helpers
+# ---------------------------------------------------------------------------
+
+
+def encode_call(fn) -> bytes:
+    """Encode a bound contract function call into raw calldata."""
+    selector = function_abi_to_4byte_selector(fn.abi)
+    return selector + abi_encode(get_abi_input_types(fn.abi), fn.args)
+
+
+def dynamic_return_value(data: bytes) -> bytes:
+    """
+    The encoded value of return data holding a single dynamic array, from its
+    length word onwards, exactly as it is embedded in calldata.
+    """
+    data = bytes(data)
+    if not data:
+        return b""
+    return data[int.from_bytes(data[:32], "big"):]
+
+
+def array_length(encoded: bytes) -> int:
+    return int.from_bytes(encoded[:32], "big") if encoded else 0
+
+
+def decode_action_data(data: bytes) -> bytes:
+    """
+    Slice the packed action words out of ABI-encoded getTally return data.
+
+    The return value is a dynamic array of static (address, uint256) tuples,
+    so after the length word every action is exactly two words. The words are
+    returned as-is, without decoding any address.
+    """
+    encoded = dynamic_return_value(data)
+    count = array_length(encoded)
+    if count and len(encoded) < 32 + count * ACTION_SIZE:
+        raise ValueError(f"getTally returned {len(encoded)} bytes for {count} action(s)")
+    return encoded[32:32 + count * ACTION_SIZE]
+
+
+def encode_round_call(fn, round_num: int, encoded_array: bytes) -> bytes:
+    """Encode fn(round, array) calldata around an array that is already ABI-encoded."""
+    return (
+        function_abi_to_4byte_selector(fn.abi)
+        + round_num.to_bytes(32, "big")
+        + (64).to_bytes(32, "big")
+        + encoded_array
+    )
+
+
+def decode_result(fn, data: bytes) -> Any:
+    """Decode raw return data the same way ContractFunction.call() does."""
+    output_types = get_abi_output_types(fn.abi)
+    values = [
+        Web3.to_checksum_address(value) if output_type == "address" else value
+        for output_type, value in zip(output_types, abi_decode(output_types, bytes(data)))
+    ]
+    if len(values) == 1:
+        return values[0]
+    return list(values)
+
+
+# ---------------------------------------------------------------------------
+# Round detail cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class RoundDetails:
+    """
+    Slash actions and veto state loaded for one round.
+
+    Actions are kept as the packed ABI words returned by getTally (a 32-byte
+    address word and a 32-byte amount word per action), so matching them
+    against our validators never builds address strings for other attesters.
+    """
+
+    action_data: bytes = field(default=b"", repr=False)
+    payload: str | None = None
+    is_vetoed: bool = False
+    committees_hash: str | None = None
+
+    @classmethod
+    def from_actions(cls, actions: list[tuple[str, int]], **kwargs) -> "RoundDetails":
+        """Build details from decoded (address, amount) actions."""
+        action_data = b"".join(
+            bytes(12) + bytes.fromhex(addr[2:]) + amount.to_bytes(32, "big")
+            for addr, amount in actions
+        )
+        return cls(action_data=action_data, **kwargs)
+
+    @property
+    def actions(self) -> list[tuple[str, int]]:
+        """All actions as (lowercase address, amount) pairs."""
+        data = self.action_data
+        return [
+            ("0x" + data[i + 12:i + 32].hex(), int.from_bytes(data[i + 32:i + ACTION_SIZE], "big"))
+            for i in range(0, len(data), ACTION_SIZE)
+        ]
+
+    def targets(self, our_keys: frozenset[bytes]) -> list[tuple[str, int]]:
+        """Actions whose 20-byte validator address is in our_keys."""
+        data = self.action_data
+        return [
+            ("0x" + data[i + 12:i + 32].hex(), int.from_bytes(data[i + 32:i + ACTION_SIZE], "big"))
+            for i in range(0, len(data), ACTION_SIZE)
+            if data[i + 12:i + 32] in our_keys
+        ]
+
+
+@dataclass
+class RoundSnapshot:
+    """State of one slashing round as of the last successful read."""
+
+    round_num: int
+    vote_count: int
+    is_executed: bool
+    status: str
+    details: RoundDetails | None = None
+
+
+class RoundDetailCache:
+    """
+    Bounded LRU cache of finalized round details.
+
+    Keyed by (chain_id, tally address, round). Only rounds whose voting has
+    closed are stored, since their committees, tally and payload can no longer
+    change.
+    """
+
+    def __init__(self, max_size: int = DETAIL_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[int, str, int], RoundDetails] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[int, str, int]) -> RoundDetails | None:
+        with self._lock:
+            details = self._entries.get(key)
+            if details is not None:
+                self._entries.move_to_end(key)
+            return details
+
+    def put(self, key: tuple[int, str, int], details: RoundDetails):
+        with self._lock:
+            self._entries[key] = details
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard_before(self, chain_id: int, tally: str, oldest_round: int):
+        """Drop rounds of one tally contract that fell out of the checked window."""
+        with self._lock:
+            stale = [
+                key for key in self._entries
+                if key[0] == chain_id and key[1] == tally and key[2] < oldest_round
+            ]
+            for key in stale:
+                del self._entries[key]
+
+
+# ---------------------------------------------------------------------------
+# Round metrics collector
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class RoundMetrics:
+    """Exported values for one round label."""
+
+    round: str
+    vote_count: int
+    has_quorum: bool
+    is_executed: bool
+    is_vetoed: bool
+    status: str
+    executable_slot: int
+    expiry_slot: int
+
+
+@dataclass(frozen=True)
+class RoundMetricsSnapshot:
+    """Immutable per-round view of one poll, swapped in as a whole."""
+
+    rounds: tuple[RoundMetrics, ...] = ()
+    # (round, validator, slash amount) for every action targeting our validators
+    targets: tuple[tuple[str, str, int], ...] = ()
+    # Countdowns are derived at scrape time so unchanged rounds keep their entry
+    current_slot: int = 0
+    slot_duration: int = 0
+
+    def seconds_until(self, slot: int) -> int:
+        return max(0, slot - self.current_slot) * self.slot_duration
+
+
+class RoundMetricsCollector:
+    """
+    Generates the per-round and our-validator metric families at scrape time.
+
+    Each poll publishes a complete RoundMetricsSnapshot for its network with
+    a single reference assignment, so a scrape never sees a half-updated
+    cycle and rounds that leave the checked window disappear without label
+    removal.
+    """
+
+    def __init__(self):
+        self._snapshots: dict[str, RoundMetricsSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, network: str, snapshot: RoundMetricsSnapshot):
+        with self._lock:
+            self._snapshots = {**self._snapshots, network: snapshot}
+
+    def describe(self):
+        return self._families({})
+
+    def collect(self):
+        return self._families(self._snapshots)
+
+    @staticmethod
+    def _families(snapshots: dict[str, RoundMetricsSnapshot]) -> list[GaugeMetricFamily]:
+        vote_count = GaugeMetricFamily(
+            "aztec_slashing_round_vote_count",
+            "Vote count for a slashing round",
+            labels=["network", "round"],
+        )
+        has_quorum = GaugeMetricFamily(
+            "aztec_slashing_round_has_quorum",
+            "Whether a round has reached quorum (1=yes, 0=no)",
+            labels=["network", "round"],
+        )
+        is_executed = GaugeMetricFamily(
+            "aztec_slashing_round_is_executed",
+            "Whether a round has been executed (1=yes, 0=no)",
+            labels=["network", "round"],
+        )
+        is_vetoed = GaugeMetricFamily(
+            "aztec_slashing_round_is_vetoed",
+            "Whether a round has been vetoed (1=yes, 0=no)",
+            labels=["network", "round"],
+        )
+        seconds_until_executable = GaugeMetricFamily(
+            "aztec_slashing_round_seconds_until_executable",
+            "Seconds until a round becomes executable",
+            labels=["network", "round"],
+        )
+        seconds_until_expires = GaugeMetricFamily(
+            "aztec_slashing_round_seconds_until_expires",
+            "Seconds until a round expires",
+            labels=["network", "round"],
+        )
+        status = GaugeMetricFamily(
+            "aztec_slashing_round_status",
+            "Round status encoded as int: 0=expired, 1=voting, 2=quorum-reached, "
+            "3=in-veto-window, 4=executable, 5=executed",
+            labels=["network", "round"],
+        )
+        targeted = GaugeMetricFamily(
+            "aztec_slashing_our_validator_targeted",
+            "Whether our validator is targeted in a round (1=yes, 0=no)",
+            labels=["network", "round", "validator"],
+        )
+        slash_amount = GaugeMetricFamily(
+            "aztec_slashing_our_validator_slash_amount",
+            "Slash amount targeting our validator in a round (wei)",
+            labels=["network", "round", "validator"],
+        )
+        targeted_total = GaugeMetricFamily(
+            "aztec_slashing_our_validator_targeted_rounds_total",
+            "Total number of active rounds targeting any of our validators",
+            labels=["network"],
+        )
+
+        for network, snapshot in snapshots.items():
+            for r in snapshot.rounds:
+                labels = [network, r.round]
+                vote_count.add_metric(labels, r.vote_count)
+                has_quorum.add_metric(labels, 1 if r.has_quorum else 0)
+                is_executed.add_metric(labels, 1 if r.is_executed else 0)
+                is_vetoed.add_metric(labels, 1 if r.is_vetoed else 0)
+                seconds_until_executable.add_metric(labels, snapshot.seconds_until(r.executable_slot))
+                seconds_until_expires.add_metric(labels, snapshot.seconds_until(r.expiry_slot))
+                status.add_metric(labels, STATUS_MAP.get(r.status, 0))
+
+            for round_label, validator, amount in snapshot.targets:
+                targeted.add_metric([network, round_label, validator], 1)
+                slash_amount.add_metric([network, round_label, validator], amount)
+            targeted_total.add_metric(
+                [network], len({round_label for round_label, _, _ in snapshot.targets}),
+            )
+
+        return [
+            vote_count, has_quorum, is_executed, is_vetoed, seconds_until_executable,
+            seconds_until_expires, status, targeted, slash_amount, targeted_total,
+        ]
+
+
+ROUND_METRICS = RoundMetricsCollector()
+REGISTRY.register(ROUND_METRICS)
+
+
+# ---------------------------------------------------------------------------
+# Round history store
+# ---------------------------------------------------------------------------
+
+
+class RoundHistoryStore:
+    """
+    SQLite store of the latest snapshot of every checked round.
+
+    Lets a restarted monitor serve its last known state immediately and skip
+    re-reading rounds that can no longer change.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS round_snapshots (
+                    chain_id INTEGER NOT NULL,
+                    tally TEXT NOT NULL,
+                    round INTEGER NOT NULL,
+                    vote_count INTEGER NOT NULL,
+                    is_executed INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    committees_hash TEXT,
+                    actions TEXT,
+                    payload TEXT,
+                    is_vetoed INTEGER,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (chain_id, tally, round)
+                )""",
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS poll_state (
+                    chain_id INTEGER NOT NULL,
+                    tally TEXT NOT NULL,
+                    current_round INTEGER NOT NULL,
+                    current_slot INTEGER NOT NULL,
+                    block INTEGER,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (chain_id, tally)
+                )""",
+            )
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(poll_state)")]
+            if "block" not in columns:
+                self._conn.execute("ALTER TABLE poll_state ADD COLUMN block INTEGER")
+
+    def load(
+        self, chain_id: int, tally: str,
+    ) -> tuple[int, int, int | None, list[RoundSnapshot]]:
+        """Return (current_round, current_slot, block, snapshots) from the last saved poll."""
+        row = self._conn.execute(
+            "SELECT current_round, current_slot, block FROM poll_state WHERE chain_id = ? AND tally = ?",
+            (chain_id, tally),
+        ).fetchone()
+        if row is None:
+            return 0, 0, None, []
+        current_round, current_slot, block = row
+
+        snapshots = []
+        for (round_num, vote_count, is_executed, status, committees_hash,
+             actions, payload, is_vetoed) in self._conn.execute(
+                """SELECT round, vote_count, is_executed, status, committees_hash,
+                          actions, payload, is_vetoed
+                   FROM round_snapshots WHERE chain_id = ? AND tally = ?
+                   ORDER BY round""",
+                (chain_id, tally)):
+            details = None
+            if actions is not None:
+                details = RoundDetails.from_actions(
+                    [(addr, int(amount)) for addr, amount in json.loads(actions)],
+                    payload=payload,
+                    is_vetoed=bool(is_vetoed),
+                    committees_hash=committees_hash,
+                )
+            snapshots.append(RoundSnapshot(
+                round_num=round_num,
+                vote_count=vote_count,
+                is_executed=bool(is_executed),
+                status=status,
+                details=details,
+            ))
+        return current_round, current_slot, block, snapshots
+
+    def save(
+        self,
+        chain_id: int,
+        tally: str,
+        current_round: int,
+        current_slot: int,
+        snapshots: list[RoundSnapshot],
+        block: int | None = None,
+    ):
+        """Upsert the snapshots of one poll and drop rounds older than the window."""
+        now = time.time()
+        rows = []
+        for snapshot in snapshots:
+            details = snapshot.details
+            rows.append((
+                chain_id, tally, snapshot.round_num, snapshot.vote_count,
+                int(snapshot.is_executed), snapshot.status,
+                details.committees_hash if details else None,
+                json.dumps([[addr, str(amount)] for addr, amount in details.actions]) if details else None,
+                details.payload if details else None,
+                int(details.is_vetoed) if details else None,
+                now,
+            ))
+
+        with self._conn:
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO round_snapshots
+                   (chain_id, tally, round, vote_count, is_executed, status,
+                    committees_hash, actions, payload, is_vetoed, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            self._conn.execute(
+                """INSERT OR REPLACE INTO poll_state
+                   (chain_id, tally, current_round, current_slot, block, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (chain_id, tally, current_round, current_slot, block, now),
+            )
+            if snapshots:
+                self._conn.execute(
+                    "DELETE FROM round_snapshots WHERE chain_id = ? AND tally = ? AND round < ?",
+                    (chain_id, tally, min(s.round_num for s in snapshots)),
+                )
+
+
+# ---------------------------------------------------------------------------
+# Backfill store
+# ---------------------------------------------------------------------------
+
+
+class BackfillStore:
+    """
+    SQLite history of every round walked by --backfill.
+
+    One row per round plus one row per slash action, with a per-contract
+    checkpoint so an interrupted backfill resumes where it stopped. Rounds
+    whose getRound call failed are listed separately so the checkpoint can
+    move past them; the next backfill retries them first.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        with self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS backfill_rounds (
+                    chain_id INTEGER NOT NULL,
+                    tally TEXT NOT NULL,
+                    round INTEGER NOT NULL,
+                    vote_count INTEGER NOT NULL,
+                    is_executed INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    has_details INTEGER NOT NULL,
+                    committees_hash TEXT,
+                    payload TEXT,
+                    is_vetoed INTEGER,
+                    targets_us INTEGER NOT NULL,
+                    PRIMARY KEY (chain_id, tally, round)
+                )""",
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS backfill_actions (
+                    chain_id INTEGER NOT NULL,
+                    tally TEXT NOT NULL,
+                    round INTEGER NOT NULL,
+                    validator TEXT NOT NULL,
+                    slash_amount TEXT NOT NULL,
+                    PRIMARY KEY (chain_id, tally, round, validator)
+                )""",
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS backfill_progress (
+                    chain_id INTEGER NOT NULL,
+                    tally TEXT NOT NULL,
+                    next_round INTEGER NOT NULL,
+                    PRIMARY KEY (chain_id, tally)
+                )""",
+            )
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS backfill_failed_rounds (
+                    chain_id INTEGER NOT NULL,
+                    tally TEXT NOT NULL,
+                    round INTEGER NOT NULL,
+                    PRIMARY KEY (chain_id, tally, round)
+                )""",
+            )
+
+    def next_round(self, chain_id: int, tally: str) -> int | None:
+        row = self._conn.execute(
+            "SELECT next_round FROM backfill_progress WHERE chain_id = ? AND tally = ?",
+            (chain_id, tally),
+        ).fetchone()
+        return row[0] if row else None
+
+    def failed_rounds(self, chain_id: int, tally: str) -> list[int]:
+        rows = self._conn.execute(
+            "SELECT round FROM backfill_failed_rounds WHERE chain_id = ? AND tally = ? ORDER BY round",
+            (chain_id, tally),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def save_chunk(
+        self,
+        chain_id: int,
+        tally: str,
+        snapshots: list[RoundSnapshot],
+        our_keys: frozenset[bytes],
+        next_round: int,
+        failed_rounds: list[int] | None = None,
+    ):
+        """
+        Write one chunk of rounds, record the rounds that could not be read
+        and advance the checkpoint atomically.
+        """
+        round_rows = []
+        action_rows = []
+        for snapshot in snapshots:
+            details = snapshot.details
+            actions = details.actions if details else []
+            targets_us = details is not None and bool(details.targets(our_keys))
+            round_rows.append((
+                chain_id, tally, snapshot.round_num, snapshot.vote_count,
+                int(snapshot.is_executed), snapshot.status, int(details is not None),
+                details.committees_hash if details else None,
+                details.payload if details else None,
+                int(details.is_vetoed) if details else None,
+                int(targets_us),
+            ))
+            action_rows.extend(
+                (chain_id, tally, snapshot.round_num, addr, str(amount))
+                for addr, amount in actions
+            )
+
+        with self._conn:
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO backfill_rounds
+                   (chain_id, tally, round, vote_count, is_executed, status, has_details,
+                    committees_hash, payload, is_vetoed, targets_us)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                round_rows,
+            )
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO backfill_actions
+                   (chain_id, tally, round, validator, slash_amount)
+                   VALUES (?, ?, ?, ?, ?)""",
+                action_rows,
+            )
+            self._conn.executemany(
+                "DELETE FROM backfill_failed_rounds WHERE chain_id = ? AND tally = ? AND round = ?",
+                [(chain_id, tally, snapshot.round_num) for snapshot in snapshots],
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO backfill_failed_rounds (chain_id, tally, round) VALUES (?, ?, ?)",
+                [(chain_id, tally, round_num) for round_num in failed_rounds or []],
+            )
+            self._conn.execute(
+                """INSERT OR REPLACE INTO backfill_progress (chain_id, tally, next_round)
+                   VALUES (?, ?, ?)""",
+                (chain_id, tally, max(next_round, self.next_round(chain_id, tally) or 0)),
+            )
+
+
+# ---------------------------------------------------------------------------
+# Contract constants
+# ---------------------------------------------------------------------------
+
+# SlashingMonitor attributes holding the immutable contract parameters
+CONSTANT_NAMES = ("quorum", "round_size", "execution_delay", "lifetime", "slash_offset", "slot_duration")
+
+
+class ConstantsCache:
+    """
+    On-disk contract constants from the last successful L1 read, keyed by
+    chain ID, tally and rollup address.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._entries: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+        if path is not None and path.exists():
+            try:
+                with open(path) as f:
+                    self._entries = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning("Failed to read constants cache %s: %s", path, e)
+
+    def get(self, key: str) -> dict[str, int] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or any(name not in entry for name in ("chain_id", *CONSTANT_NAMES)):
+            return None
+        return entry
+
+    def put(self, key: str, constants: dict[str, int]):
+        with self._lock:
+            if self._entries.get(key) == constants:
+                return
+            self._entries[key] = constants
+            if self.path is None:
+                return
+            try:
+                write_json_atomic(self.path, self._entries)
+            except IOError as e:
+                logger.warning("Failed to save constants cache %s: %s", self.path, e)
+
+
 # ---------------------------------------------------------------------------
 # Slashing monitor
 # ---------------------------------------------------------------------------
 
 
 class SlashingMonitor:
-    def __init__(self, w3: Web3, network: str, our_addresses: list[str]):
+    def __init__(
+        self,
+        w3: Web3,
+        network: str,
+        our_addresses: list[str],
+        history: RoundHistoryStore | None = None,
+        executor: ThreadPoolExecutor | None = None,
+        constants_cache: ConstantsCache | None = None,
+    ):
         addrs = CONTRACTS.get(network, CONTRACTS["mainnet"])
+        self.network = network
         self.w3 = w3
-        self.our_addresses = set(our_addresses)
+        self.our_addresses = our_addresses
+        self.history = history
+        self.executor = executor
+        self.constants_cache = constants_cache
+        self.rpc_slots = threading.BoundedSemaphore(RPC_MAX_CONCURRENCY)
 
         self.tally = w3.eth.contract(
             address=Web3.to_checksum_address(addrs["tally"]),
@@ -293,8 +1366,33 @@ class SlashingMonitor:
             address=Web3.to_checksum_address(addrs["rollup"]),
             abi=ROLLUP_ABI,
         )
+        self.multicall = None
+        if MULTICALL_ENABLED:
+            self.multicall = w3.eth.contract(
+                address=Web3.to_checksum_address(MULTICALL3_ADDRESS),
+                abi=MULTICALL3_ABI,
+            )
 
-        # Contract constants (loaded once)
+        self.detail_cache = RoundDetailCache()
+        self.round_snapshots: dict[int, RoundSnapshot] = {}
+        # Last published snapshot, metric entry and targets per round
+        self.published: dict[int, tuple[RoundSnapshot, RoundMetrics, tuple]] = {}
+        self.current_slot: int = 0
+        self.slot_read_at: float = 0.0
+
+        # Every read in a poll cycle is pinned to the block captured at its start
+        self.block_identifier: int | str = "latest"
+        self.last_polled_block: int | None = None
+        self.last_polled_slot: int | None = None
+
+        # Event-driven refresh: last block whose Tally logs were processed and
+        # the rounds those logs touched since the last round sweep
+        self.log_checkpoint: int | None = None
+        self.dirty_rounds: set[int] = set()
+
+        # Contract constants, from the cache or L1; set once either is applied
+        self.constants_ready = threading.Event()
+        self.chain_id: int = 0
         self.quorum: int = 0
         self.round_size: int = 0
         self.execution_delay: int = 0
@@ -302,25 +1400,60 @@ class SlashingMonitor:
         self.slash_offset: int = 0
         self.slot_duration: int = 0
 
-        # Track which round labels we've set so we can clean up stale ones
-        self._active_round_labels: set[str] = set()
-        self._active_validator_labels: set[tuple[str, str]] = set()
+    @cached_property
+    def log(self) -> NetworkLogAdapter:
+        return NetworkLogAdapter(logger, {"network": self.network})
 
     def load_constants(self):
-        """Load immutable contract parameters (called once at startup)."""
-        self.quorum = self.tally.functions.QUORUM().call()
-        self.round_size = self.tally.functions.ROUND_SIZE().call()
-        self.execution_delay = self.tally.functions.EXECUTION_DELAY_IN_ROUNDS().call()
-        self.lifetime = self.tally.functions.LIFETIME_IN_ROUNDS().call()
-        self.slash_offset = self.tally.functions.SLASH_OFFSET_IN_ROUNDS().call()
-        self.slot_duration = self.rollup.functions.getSlotDuration().call()
-
-        QUORUM_THRESHOLD.set(self.quorum)
-
-        logger.info(
-            "Contract constants: quorum=%d, round_size=%d, "
+        """Read the chain ID and immutable contract parameters from L1 in one batch."""
+        chain_id = self._rpc("eth_chainId", lambda: self.w3.eth.chain_id)
+        calls = [
+            self.tally.functions.QUORUM(),
+            self.tally.functions.ROUND_SIZE(),
+            self.tally.functions.EXECUTION_DELAY_IN_ROUNDS(),
+            self.tally.functions.LIFETIME_IN_ROUNDS(),
+            self.tally.functions.SLASH_OFFSET_IN_ROUNDS(),
+            self.rollup.functions.getSlotDuration(),
+        ]
+        results = self._call_many(calls)
+        for fn, (success, _) in zip(calls, results):
+            if not success:
+                raise RuntimeError(f"failed to read {fn.fn_name}")
+
+        constants = {"chain_id": chain_id, **dict(zip(CONSTANT_NAMES, (value for _, value in results)))}
+        self._apply_constants(constants, "L1")
+        if self.constants_cache is not None:
+            self.constants_cache.put(self._constants_key(chain_id), constants)
+
+    def restore_constants(self) -> bool:
+        """
+        Apply the constants a previous run cached for the chain the RPC serves
+        now. Returns whether there were any. The live chain ID keeps a cache
+        or history from another chain with the same addresses out of use.
+        """
+        if self.constants_cache is None:
+            return False
+        chain_id = self._rpc("eth_chainId", lambda: self.w3.eth.chain_id)
+        constants = self.constants_cache.get(self._constants_key(chain_id))
+        if constants is None:
+            return False
+        self._apply_constants(constants, "cache")
+        return True
+
+    def _constants_key(self, chain_id: int) -> str:
+        return f"{chain_id}:{self.tally.address}:{self.rollup.address}"
+
+    def _apply_constants(self, constants: dict[str, int], source: str):
+        self.chain_id = constants["chain_id"]
+        for name in CONSTANT_NAMES:
+            setattr(self, name, constants[name])
+        QUORUM_THRESHOLD.labels(self.network).set(self.quorum)
+        self.constants_ready.set()
+
+        self.log.info(
+            "Contract constants from %s: chain_id=%d, quorum=%d, round_size=%d, "
             "execution_delay=%d, lifetime=%d, slash_offset=%d, slot_duration=%ds",
-            self.quorum, self.round_size,
+            source, self.chain_id, self.quorum, self.round_size,
             self.execution_delay, self.lifetime, self.slash_offset, self.slot_duration,
         )
 
@@ -393,163 +1526,683 @@ class SlashingMonitor:
             return 0
         return (target_slot - current_slot) * self.slot_duration
 
+    def transition_slots(self, round_num: int) -> list[int]:
+        """Slots at which a round with quorum changes status, in order."""
+        executable_slot = self.calculate_executable_slot(round_num)
+        return [
+            executable_slot,
+            executable_slot + self.round_size,
+            self.calculate_expiry_slot(round_num),
+        ]
+
+    def next_poll_interval(self) -> int:
+        """
+        Seconds until the next poll.
+
+        Polls just after the nearest upcoming state transition of a pending
+        round that targets our validators, bounded by MIN_POLL_INTERVAL, and
+        falls back to POLL_INTERVAL when nothing is pending.
+        """
+        interval = POLL_INTERVAL
+        elapsed = time.time() - self.slot_read_at
+
+        for snapshot in self.round_snapshots.values():
+            if snapshot.is_executed or snapshot.status == "expired":
+                continue
+            if not self._targets_us(snapshot):
+                continue
+            for slot in self.transition_slots(snapshot.round_num):
+                if slot > self.current_slot:
+                    # Aim one slot past the transition so the new state is visible
+                    seconds = self.seconds_until_slot(slot, self.current_slot) + self.slot_duration
+                    interval = min(interval, math.ceil(seconds - elapsed))
+                    break
+
+        return min(POLL_INTERVAL, max(MIN_POLL_INTERVAL, interval))
+
+    def _targets_us(self, snapshot: RoundSnapshot) -> bool:
+        if snapshot.details is None:
+            return False
+        return bool(snapshot.details.targets(self.our_keys))
+
+    def _call_many(self, fns: list) -> list[tuple[bool, Any]]:
+        """
+        Execute several read-only calls, batched through Multicall3 when enabled.
+
+        Returns one (success, value) pair per call so a single revert does not
+        fail the rest of the batch. If a whole batch fails (e.g. no Multicall3
+        deployment), its calls are retried one by one.
+        """
+        if self.multicall is None:
+            return [self._call_isolated(fn) for fn in fns]
+
+        results: list[tuple[bool, Any]] = []
+        for start in range(0, len(fns), MULTICALL_BATCH_SIZE):
+            chunk = fns[start:start + MULTICALL_BATCH_SIZE]
+            try:
+                results.extend(self._aggregate3(chunk))
+            except Exception as e:
+                self.log.warning("Multicall3 batch failed, falling back to individual calls: %s", e)
+                results.extend(self._call_isolated(fn) for fn in chunk)
+        return results
+
+    def _aggregate3(self, fns: list) -> list[tuple[bool, Any]]:
+        """Run one Multicall3 aggregate3 call with per-call failure allowed."""
+        calls = [(fn.address, True, encode_call(fn)) for fn in fns]
+        # Label the batch by what it carries so global reads and round reads
+        # do not all land under a single "aggregate3" series
+        function = f"aggregate3({','.join(sorted({fn.fn_name for fn in fns}))})"
+        raw_results = self._call(self.multicall.functions.aggregate3(calls), function=function)
+
+        results: list[tuple[bool, Any]] = []
+        for fn, (success, return_data) in zip(fns, raw_results):
+            if success:
+                try:
+                    results.append((True, decode_result(fn, return_data)))
+                    MULTICALL_INNER_CALLS.labels(self.network, fn.fn_name, "success").inc()
+                    continue
+                except Exception as e:
+                    self.log.debug("Failed to decode %s result: %s", fn.fn_name, e)
+            MULTICALL_INNER_CALLS.labels(self.network, fn.fn_name, "error").inc()
+            results.append((False, None))
+        return results
+
+    def _call_isolated(self, fn) -> tuple[bool, Any]:
+        try:
+            return True, self._call(fn)
+        except Exception as e:
+            self.log.debug("Call %s failed: %s", fn.fn_name, e)
+            return False, None
+
+    def _call(self, fn, function: str | None = None) -> Any:
+        """Execute one contract read at the pinned block."""
+        return decode_result(fn, self._call_raw(fn, function=function))
+
+    def _call_raw(self, fn, data: bytes | None = None, function: str | None = None) -> bytes:
+        """Execute one contract read at the pinned block and return the undecoded return data."""
+        function = function or fn.fn_name
+        transaction = {"to": fn.address, "data": data if data is not None else encode_call(fn)}
+        result = bytes(self._rpc(
+            function, lambda: self.w3.eth.call(transaction, block_identifier=self.block_identifier),
+        ))
+        RPC_RESPONSE_BYTES.labels(self.network, function).inc(len(result))
+        return result
+
+    def _rpc(self, function: str, request) -> Any:
+        """Run one RPC request under the concurrency cap and record its latency and outcome."""
+        with self.rpc_slots:
+            started = time.monotonic()
+            try:
+                result = request()
+            except Exception:
+                RPC_CALLS.labels(self.network, function, "error").inc()
+                raise
+            finally:
+                RPC_CALL_DURATION.labels(self.network, function).observe(time.monotonic() - started)
+        RPC_CALLS.labels(self.network, function, "success").inc()
+        return result
+
+    def _map(self, func, items: list) -> list:
+        """Apply func to items on the worker pool, preserving order."""
+        if self.executor is None or len(items) < 2:
+            return [func(item) for item in items]
+        return list(self.executor.map(func, items))
+
     def poll(self):
         """Run a single poll cycle."""
+        # Pin the whole cycle to one block so all reads see the same state
+        head_block = self._rpc("eth_blockNumber", lambda: self.w3.eth.block_number)
+        if head_block == self.last_polled_block:
+            self.log.info("L1 head unchanged at block %d, skipping poll", head_block)
+            return
+        self.block_identifier = head_block
+
+        # With Tally logs followed up to the pinned block, only rounds touched
+        # by a log need their on-chain state re-read
+        logs_synced = False
+        if LOG_POLL_INTERVAL > 0 and self.log_checkpoint is not None:
+            try:
+                self.check_logs(head_block)
+                logs_synced = True
+            except Exception as e:
+                self.log.warning("Failed to read Tally logs, refreshing all rounds: %s", e)
+
         # Get current chain state
-        current_round = self.tally.functions.getCurrentRound().call()
-        current_slot = self.rollup.functions.getCurrentSlot().call()
-        is_enabled = self.slasher.functions.isSlashingEnabled().call()
-        disabled_until = self.slasher.functions.slashingDisabledUntil().call()
-        active_attesters = self.rollup.functions.getActiveAttesterCount().call()
+        global_calls = [
+            self.tally.functions.getCurrentRound(),
+            self.rollup.functions.getCurrentSlot(),
+            self.slasher.functions.isSlashingEnabled(),
+            self.slasher.functions.slashingDisabledUntil(),
+            self.rollup.functions.getActiveAttesterCount(),
+        ]
+        global_results = self._call_many(global_calls)
+        for fn, (success, _) in zip(global_calls, global_results):
+            if not success:
+                raise RuntimeError(f"failed to read {fn.fn_name}")
+        (
+            current_round, current_slot, is_enabled, disabled_until, active_attesters,
+        ) = [value for _, value in global_results]
+        self.current_slot = current_slot
+        self.slot_read_at = time.time()
 
         # Update global metrics
-        CURRENT_ROUND.set(current_round)
-        CURRENT_SLOT.set(current_slot)
-        SLASHING_ENABLED.set(1 if is_enabled else 0)
-        SLASHING_DISABLED_UNTIL.set(disabled_until)
-        ACTIVE_ATTESTER_COUNT.set(active_attesters)
-
-        logger.info(
-            "State: round=%d, slot=%d, slashing_enabled=%s, active_attesters=%d",
-            current_round, current_slot, is_enabled, active_attesters,
+        CURRENT_ROUND.labels(self.network).set(current_round)
+        CURRENT_SLOT.labels(self.network).set(current_slot)
+        SLASHING_ENABLED.labels(self.network).set(1 if is_enabled else 0)
+        SLASHING_DISABLED_UNTIL.labels(self.network).set(disabled_until)
+        ACTIVE_ATTESTER_COUNT.labels(self.network).set(active_attesters)
+
+        self.log.info(
+            "State: block=%d, round=%d, slot=%d, slashing_enabled=%s, active_attesters=%d",
+            head_block, current_round, current_slot, is_enabled, active_attesters,
         )
 
+        # Round state can only move with the Aztec slot or a Tally event
+        if current_slot == self.last_polled_slot and not self.dirty_rounds:
+            self.log.info("Aztec slot unchanged at %d, skipping round sweep", current_slot)
+            self._mark_polled(head_block, current_slot)
+            return
+
         rounds_to_check = self.build_rounds_to_check(current_round)
-        logger.info("Checking %d rounds: %s", len(rounds_to_check), rounds_to_check)
+        self.log.info("Checking %d rounds: %s", len(rounds_to_check), rounds_to_check)
+        if rounds_to_check:
+            self.detail_cache.discard_before(
+                self.chain_id, self.tally.address, rounds_to_check[0],
+            )
 
-        new_round_labels: set[str] = set()
-        new_validator_labels: set[tuple[str, str]] = set()
-        our_targeted_count = 0
+        # Rounds that can no longer change are served from their last snapshot
+        to_refresh = [
+            round_num for round_num in rounds_to_check
+            if self._needs_refresh(round_num, logs_synced)
+        ]
+        round_results = self._call_many(
+            [self.tally.functions.getRound(round_num) for round_num in to_refresh],
+        )
+        fetched = dict(zip(to_refresh, round_results))
 
+        by_round: dict[int, RoundSnapshot] = {}
+        pending: list[tuple[int, bool, int]] = []
         for round_num in rounds_to_check:
-            round_label = str(round_num)
-            new_round_labels.add(round_label)
+            previous = self.round_snapshots.get(round_num)
+            if round_num not in fetched:
+                if self._is_final(previous):
+                    by_round[round_num] = previous
+                else:
+                    # No Tally log since the last poll: votes and execution are
+                    # unchanged, but the status still moves with the slot
+                    pending.append((round_num, previous.is_executed, previous.vote_count))
+                continue
+
+            success, round_data = fetched[round_num]
+            if not success:
+                self.log.warning("Failed to get round %d", round_num)
+                if previous is not None:
+                    by_round[round_num] = previous
+                continue
 
+            is_executed, vote_count = round_data
+            pending.append((round_num, is_executed, vote_count))
+
+        # Rounds whose vote count, executed flag and status are unchanged keep
+        # their previous snapshot and details
+        changed: list[tuple[int, bool, int]] = []
+        unchanged: list[RoundSnapshot] = []
+        for round_num, is_executed, vote_count in pending:
+            previous = self.round_snapshots.get(round_num)
+            if self._is_unchanged(previous, current_round, current_slot, is_executed, vote_count):
+                unchanged.append(previous)
+            else:
+                changed.append((round_num, is_executed, vote_count))
+        self.log.info("%d round(s) changed, %d unchanged", len(changed), len(unchanged))
+
+        # Evaluate changed rounds (and load their details) concurrently;
+        # metrics are only published afterwards, from this thread
+        evaluated = self._map(
+            lambda item: self._evaluate_round(item[0], current_round, current_slot, item[1], item[2]),
+            changed,
+        )
+        for snapshot in self._refresh_vetoes(unchanged) + evaluated:
+            by_round[snapshot.round_num] = snapshot
+        snapshots = [by_round[round_num] for round_num in rounds_to_check if round_num in by_round]
+
+        self._publish(snapshots, current_slot)
+        self.round_snapshots = {snapshot.round_num: snapshot for snapshot in snapshots}
+
+        if self.history is not None:
             try:
-                is_executed, vote_count = self.tally.functions.getRound(round_num).call()
+                self.history.save(
+                    self.chain_id, self.tally.address, current_round, current_slot, snapshots,
+                    block=head_block,
+                )
             except Exception as e:
-                logger.warning("Failed to get round %d: %s", round_num, e)
-                continue
+                self.log.warning("Failed to save round history: %s", e)
+
+        self.dirty_rounds.clear()
+        if LOG_POLL_INTERVAL > 0:
+            self.log_checkpoint = head_block
+        self._mark_polled(head_block, current_slot)
 
-            has_quorum = vote_count >= self.quorum
-            status = self.calculate_round_status(
+    def backfill(
+        self,
+        store: BackfillStore,
+        from_round: int,
+        to_round: int | None = None,
+        chunk_size: int = BACKFILL_CHUNK_SIZE,
+    ) -> int:
+        """
+        Walk rounds from from_round (or the stored checkpoint) to to_round
+        (default: current round) in chunks and record them in the store.
+        Rounds that failed in an earlier run are retried first. Returns the
+        number of rounds written.
+        """
+        current_round, _ = self._pin_head()
+        if to_round is None:
+            to_round = current_round
+
+        resume_round = store.next_round(self.chain_id, self.tally.address)
+        start_round = max(from_round, resume_round or 0)
+        if resume_round is not None and resume_round > from_round:
+            self.log.info("Resuming backfill at round %d", resume_round)
+
+        written = 0
+        retry_rounds = [
+            round_num for round_num in store.failed_rounds(self.chain_id, self.tally.address)
+            if from_round <= round_num < start_round
+        ]
+        for chunk_start in range(0, len(retry_rounds), chunk_size):
+            rounds = retry_rounds[chunk_start:chunk_start + chunk_size]
+            self.log.info("Retrying previously failed rounds %s", rounds)
+            written += self._backfill_chunk(store, rounds, start_round)
+
+        self.log.info("Backfilling rounds %d..%d at block %d", start_round, to_round, self.block_identifier)
+        for chunk_start in range(start_round, to_round + 1, chunk_size):
+            rounds = list(range(chunk_start, min(chunk_start + chunk_size, to_round + 1)))
+            written += self._backfill_chunk(store, rounds, rounds[-1] + 1)
+
+        return written
+
+    def _pin_head(self) -> tuple[int, int]:
+        """Pin reads to the current head block and return the round and slot at it."""
+        self.block_identifier = self._rpc("eth_blockNumber", lambda: self.w3.eth.block_number)
+        current_round = self._call(self.tally.functions.getCurrentRound())
+        current_slot = self._call(self.rollup.functions.getCurrentSlot())
+        return current_round, current_slot
+
+    def _backfill_chunk(self, store: BackfillStore, rounds: list[int], next_round: int) -> int:
+        """
+        Read and store one chunk of rounds. Rounds whose getRound, detail or
+        veto reads fail are recorded in the store instead of blocking the
+        checkpoint.
+
+        Each chunk is read at a fresh head block, so a long backfill does not
+        outlive the state a non-archive node keeps.
+        """
+        current_round, current_slot = self._pin_head()
+        round_results = self._call_many(
+            [self.tally.functions.getRound(round_num) for round_num in rounds],
+        )
+        read = [(round_num, result) for round_num, result in zip(rounds, round_results) if result[0]]
+        results = self._map(
+            lambda item: self._backfill_round(item[0], current_round, current_slot, *item[1][1]),
+            read,
+        )
+        snapshots = [snapshot for snapshot in results if snapshot is not None]
+        written = {snapshot.round_num for snapshot in snapshots}
+        failed = [round_num for round_num in rounds if round_num not in written]
+        if failed:
+            self.log.warning("Failed to read rounds %s, recording them for a later retry", failed)
+
+        store.save_chunk(
+            self.chain_id, self.tally.address, snapshots, self.our_keys, next_round, failed,
+        )
+        self.log.info(
+            "Backfilled rounds %d..%d (%d targeting our validators)",
+            rounds[0], rounds[-1], sum(1 for snapshot in snapshots if self._targets_us(snapshot)),
+        )
+        return len(snapshots)
+
+    def _backfill_round(
+        self,
+        round_num: int,
+        current_round: int,
+        current_slot: int,
+        is_executed: bool,
+        vote_count: int,
+    ) -> RoundSnapshot | None:
+        """Snapshot one round, or None if its details or veto flag could not be read."""
+        has_quorum = vote_count >= self.quorum
+        details = None
+        if has_quorum or is_executed:
+            try:
+                details, veto_checked = self._fetch_round_details(round_num)
+            except Exception as e:
+                self.log.warning("Failed to load details for round %d: %s", round_num, e)
+                return None
+            if not veto_checked:
+                return None
+        return RoundSnapshot(
+            round_num=round_num,
+            vote_count=vote_count,
+            is_executed=is_executed,
+            status=self.calculate_round_status(
                 round_num, current_round, current_slot, is_executed, has_quorum,
-            )
+            ),
+            details=details,
+        )
 
-            executable_slot = self.calculate_executable_slot(round_num)
-            expiry_slot = self.calculate_expiry_slot(round_num)
-
-            # Set per-round metrics
-            ROUND_VOTE_COUNT.labels(round=round_label).set(vote_count)
-            ROUND_HAS_QUORUM.labels(round=round_label).set(1 if has_quorum else 0)
-            ROUND_IS_EXECUTED.labels(round=round_label).set(1 if is_executed else 0)
-            ROUND_STATUS.labels(round=round_label).set(STATUS_MAP.get(status, 0))
-            ROUND_SECONDS_UNTIL_EXECUTABLE.labels(round=round_label).set(
-                self.seconds_until_slot(executable_slot, current_slot),
-            )
-            ROUND_SECONDS_UNTIL_EXPIRES.labels(round=round_label).set(
-                self.seconds_until_slot(expiry_slot, current_slot),
-            )
+    def check_logs(self, to_block: int | None = None) -> set[int]:
+        """
+        Read Tally VoteCast/RoundExecuted logs after the checkpoint and mark
+        the rounds they touch for refresh. Returns the rounds touched.
+        """
+        if self.log_checkpoint is None:
+            return set()
+        if to_block is None:
+            to_block = self._rpc("eth_blockNumber", lambda: self.w3.eth.block_number)
+
+        changed: set[int] = set()
+        from_block = self.log_checkpoint + 1
+        while from_block <= to_block:
+            end_block = min(to_block, from_block + LOG_MAX_BLOCK_RANGE - 1)
+            logs = self._rpc("eth_getLogs", lambda: self.w3.eth.get_logs({
+                "address": self.tally.address,
+                "fromBlock": from_block,
+                "toBlock": end_block,
+                "topics": [TALLY_EVENT_TOPICS],
+            }))
+            for log in logs:
+                if len(log["topics"]) > 1:
+                    changed.add(int.from_bytes(bytes(log["topics"][1]), "big"))
+            self.log_checkpoint = end_block
+            from_block = end_block + 1
+
+        if changed:
+            self.log.info("Tally logs touched round(s) %s", sorted(changed))
+        self.dirty_rounds |= changed
+        return changed
+
+    def _needs_refresh(self, round_num: int, logs_synced: bool) -> bool:
+        """Whether a round's getRound result has to be read again this poll."""
+        previous = self.round_snapshots.get(round_num)
+        if previous is None:
+            return True
+        if self._is_final(previous):
+            return False
+        if logs_synced:
+            return round_num in self.dirty_rounds
+        return True
+
+    def _mark_polled(self, block: int, slot: int):
+        self.last_polled_block = block
+        self.last_polled_slot = slot
+        LAST_POLL_BLOCK.labels(self.network).set(block)
+
+    def restore_history(self):
+        """Publish the snapshots stored by the previous run before the first poll."""
+        if self.history is None:
+            return
+
+        current_round, current_slot, block, snapshots = self.history.load(
+            self.chain_id, self.tally.address,
+        )
+        if not snapshots:
+            return
+
+        # Resume following Tally logs from the block the snapshots were read at
+        if LOG_POLL_INTERVAL > 0:
+            self.log_checkpoint = block
 
-            if vote_count > 0:
-                logger.info(
-                    "Round %d: votes=%d, quorum=%s, status=%s",
-                    round_num, vote_count, has_quorum, status,
+        for snapshot in snapshots:
+            if snapshot.details is not None and snapshot.status in FINAL_DETAIL_STATUSES:
+                self.detail_cache.put(
+                    (self.chain_id, self.tally.address, snapshot.round_num), snapshot.details,
                 )
 
-            # Load details for rounds with quorum or executed
-            is_vetoed = False
-            if has_quorum or is_executed:
-                try:
-                    is_vetoed = self._check_round_details(
-                        round_num, current_slot, new_validator_labels,
-                    )
-                except Exception as e:
-                    logger.warning("Failed to load details for round %d: %s", round_num, e)
+        self.current_slot = current_slot
+        CURRENT_ROUND.labels(self.network).set(current_round)
+        CURRENT_SLOT.labels(self.network).set(current_slot)
+        self._publish(snapshots, current_slot)
+        self.round_snapshots = {snapshot.round_num: snapshot for snapshot in snapshots}
+        self.log.info(
+            "Restored %d round snapshot(s) from %s (round=%d)",
+            len(snapshots), self.history.path, current_round,
+        )
 
-            ROUND_IS_VETOED.labels(round=round_label).set(1 if is_vetoed else 0)
+    @property
+    def our_addresses(self) -> set[str]:
+        return self._our_addresses
+
+    @our_addresses.setter
+    def our_addresses(self, our_addresses):
+        # Raw 20-byte keys let tally actions be matched without decoding addresses
+        self._our_addresses = set(our_addresses)
+        self.our_keys = frozenset(bytes.fromhex(addr[2:]) for addr in self._our_addresses)
+
+    def set_our_addresses(self, our_addresses: list[str]):
+        """Swap in a re-indexed validator set and republish the targets."""
+        self.our_addresses = our_addresses
+        self.published = {}
+        if self.round_snapshots:
+            snapshots = [self.round_snapshots[round_num] for round_num in sorted(self.round_snapshots)]
+            self._publish(snapshots, self.current_slot)
+
+    def _is_final(self, snapshot: RoundSnapshot | None) -> bool:
+        """Whether a round snapshot can no longer change on chain."""
+        if snapshot is None:
+            return False
+        if snapshot.is_executed:
+            return snapshot.details is not None
+        return snapshot.status == "expired" and snapshot.vote_count < self.quorum
 
-        # Count rounds targeting our validators
-        targeted_rounds = set()
-        for round_label, _ in new_validator_labels:
-            targeted_rounds.add(round_label)
-        our_targeted_count = len(targeted_rounds)
-        OUR_VALIDATOR_TARGETED_TOTAL.set(our_targeted_count)
+    def _is_unchanged(
+        self,
+        previous: RoundSnapshot | None,
+        current_round: int,
+        current_slot: int,
+        is_executed: bool,
+        vote_count: int,
+    ) -> bool:
+        """Whether a round's previous snapshot, details included, still describes it."""
+        if previous is None or previous.vote_count != vote_count or previous.is_executed != is_executed:
+            return False
+        has_quorum = vote_count >= self.quorum
+        status = self.calculate_round_status(
+            previous.round_num, current_round, current_slot, is_executed, has_quorum,
+        )
+        if status != previous.status:
+            return False
+        # A round whose detail load failed last time is retried
+        return previous.details is not None or not (has_quorum or is_executed)
 
-        if our_targeted_count > 0:
-            logger.warning(
-                "OUR VALIDATOR IS TARGETED in %d round(s)!", our_targeted_count,
-            )
+    def _refresh_vetoes(self, snapshots: list[RoundSnapshot]) -> list[RoundSnapshot]:
+        """
+        Re-read the veto flag of unchanged rounds whose veto window is open, in
+        one batch. A round whose flag flipped gets a new snapshot.
+        """
+        open_rounds = [
+            snapshot for snapshot in snapshots
+            if snapshot.details is not None and snapshot.details.payload
+            and snapshot.status in VETO_OPEN_STATUSES
+        ]
+        if not open_rounds:
+            return snapshots
+
+        results = self._call_many(
+            [self.slasher.functions.vetoedPayloads(snapshot.details.payload) for snapshot in open_rounds],
+        )
+        vetoed: dict[int, RoundSnapshot] = {}
+        for snapshot, (success, is_vetoed) in zip(open_rounds, results):
+            if not success:
+                self.log.warning("Failed to check veto status for round %d", snapshot.round_num)
+            elif bool(is_vetoed) != snapshot.details.is_vetoed:
+                vetoed[snapshot.round_num] = replace(
+                    snapshot, details=replace(snapshot.details, is_vetoed=bool(is_vetoed)),
+                )
+        return [vetoed.get(snapshot.round_num, snapshot) for snapshot in snapshots]
 
-        # Clean up stale round labels
-        stale_rounds = self._active_round_labels - new_round_labels
-        for round_label in stale_rounds:
-            ROUND_VOTE_COUNT.remove(round_label)
-            ROUND_HAS_QUORUM.remove(round_label)
-            ROUND_IS_EXECUTED.remove(round_label)
-            ROUND_IS_VETOED.remove(round_label)
-            ROUND_STATUS.remove(round_label)
-            ROUND_SECONDS_UNTIL_EXECUTABLE.remove(round_label)
-            ROUND_SECONDS_UNTIL_EXPIRES.remove(round_label)
-
-        stale_validators = self._active_validator_labels - new_validator_labels
-        for round_label, validator in stale_validators:
-            OUR_VALIDATOR_TARGETED.remove(round_label, validator)
-            OUR_VALIDATOR_SLASH_AMOUNT.remove(round_label, validator)
-
-        self._active_round_labels = new_round_labels
-        self._active_validator_labels = new_validator_labels
-
-    def _check_round_details(
+    def _evaluate_round(
         self,
         round_num: int,
+        current_round: int,
         current_slot: int,
-        new_validator_labels: set[tuple[str, str]],
-    ) -> bool:
+        is_executed: bool,
+        vote_count: int,
+    ) -> RoundSnapshot:
+        """Derive the status of a round and load its details if it has quorum."""
+        has_quorum = vote_count >= self.quorum
+        status = self.calculate_round_status(
+            round_num, current_round, current_slot, is_executed, has_quorum,
+        )
+
+        if vote_count > 0:
+            self.log.info(
+                "Round %d: votes=%d, quorum=%s, status=%s",
+                round_num, vote_count, has_quorum, status,
+            )
+
+        # Load details for rounds with quorum or executed
+        details = None
+        if has_quorum or is_executed:
+            try:
+                details = self._load_round_details(round_num, status)
+            except Exception as e:
+                self.log.warning("Failed to load details for round %d: %s", round_num, e)
+
+        return RoundSnapshot(
+            round_num=round_num,
+            vote_count=vote_count,
+            is_executed=is_executed,
+            status=status,
+            details=details,
+        )
+
+    def _publish(self, snapshots: list[RoundSnapshot], current_slot: int):
         """
-        Load detailed round info: committees, tally, payload, veto status.
-        Returns True if the round is vetoed.
+        Build the per-round metrics snapshot and swap it in for scrapes.
+
+        Metric entries are rebuilt only for rounds whose snapshot object
+        changed since the last publish; unchanged rounds reuse their entry.
         """
+        rounds: list[RoundMetrics] = []
+        targets: list[tuple[str, str, int]] = []
+        published: dict[int, tuple[RoundSnapshot, RoundMetrics, tuple]] = {}
+
+        for snapshot in snapshots:
+            round_num = snapshot.round_num
+            previous = self.published.get(round_num)
+            if previous is not None and previous[0] is snapshot:
+                _, round_metrics, round_targets = previous
+            else:
+                round_metrics, round_targets = self._round_metrics(snapshot)
+            published[round_num] = (snapshot, round_metrics, round_targets)
+            rounds.append(round_metrics)
+            targets.extend(round_targets)
+
+        self.published = published
+        ROUND_METRICS.publish(self.network, RoundMetricsSnapshot(
+            rounds=tuple(rounds),
+            targets=tuple(targets),
+            current_slot=current_slot,
+            slot_duration=self.slot_duration,
+        ))
+
+        our_targeted_count = len({round_label for round_label, _, _ in targets})
+        if our_targeted_count > 0:
+            self.log.warning(
+                "OUR VALIDATOR IS TARGETED in %d round(s)!", our_targeted_count,
+            )
+
+    def _round_metrics(self, snapshot: RoundSnapshot) -> tuple[RoundMetrics, tuple]:
+        """Metric entry and our-validator targets for one changed round."""
+        round_num = snapshot.round_num
         round_label = str(round_num)
+        details = snapshot.details
+        round_metrics = RoundMetrics(
+            round=round_label,
+            vote_count=snapshot.vote_count,
+            has_quorum=snapshot.vote_count >= self.quorum,
+            is_executed=snapshot.is_executed,
+            is_vetoed=details is not None and details.is_vetoed,
+            status=snapshot.status,
+            executable_slot=self.calculate_executable_slot(round_num),
+            expiry_slot=self.calculate_expiry_slot(round_num),
+        )
+        if details is None:
+            return round_metrics, ()
 
-        committees = self.tally.functions.getSlashTargetCommittees(round_num).call()
-        if not committees:
-            return False
+        # Check if any of our validators are targeted
+        round_targets = []
+        for validator_addr, slash_amount in details.targets(self.our_keys):
+            round_targets.append((round_label, validator_addr, slash_amount))
+            self.log.warning(
+                "SLASH TARGET: round=%d, validator=%s, amount=%d wei",
+                round_num, validator_addr, slash_amount,
+            )
+        return round_metrics, tuple(round_targets)
 
-        actions = self.tally.functions.getTally(round_num, committees).call()
-        if not actions:
-            return False
+    def _load_round_details(self, round_num: int, status: str) -> RoundDetails:
+        """
+        Load detailed round info: committees, tally, payload, veto status.
+
+        Details of rounds whose voting has closed are served from the detail
+        cache; only the veto flag is rechecked while the veto window is open.
+        """
+        cache_key = (self.chain_id, self.tally.address, round_num)
+
+        details = self.detail_cache.get(cache_key)
+        if details is None:
+            details, veto_checked = self._fetch_round_details(round_num)
+            if status in FINAL_DETAIL_STATUSES and veto_checked:
+                self.detail_cache.put(cache_key, details)
+        elif details.payload and status in VETO_OPEN_STATUSES:
+            try:
+                is_vetoed = bool(self._call(self.slasher.functions.vetoedPayloads(details.payload)))
+            except Exception as e:
+                self.log.warning("Failed to check veto status for round %d: %s", round_num, e)
+            else:
+                # Cached details are shared with earlier snapshots, so a
+                # flipped flag gets a new object rather than an in-place edit
+                if is_vetoed != details.is_vetoed:
+                    details = replace(details, is_vetoed=is_vetoed)
+                    self.detail_cache.put(cache_key, details)
+
+        return details
+
+    def _fetch_round_details(self, round_num: int) -> tuple[RoundDetails, bool]:
+        """
+        Read committees, tally, payload and veto flag for a round from L1.
+        Returns the details and whether the veto flag was read successfully.
+        """
+        details = RoundDetails()
+
+        # Committees and tally stay raw ABI data: the committees are passed
+        # straight back into getTally, and only our own validators are decoded
+        committees_data = self._call_raw(self.tally.functions.getSlashTargetCommittees(round_num))
+        committees = dynamic_return_value(committees_data)
+        if not array_length(committees):
+            return details, True
+        details.committees_hash = Web3.to_hex(Web3.keccak(committees_data))
+
+        tally_fn = self.tally.functions.getTally(round_num, [])
+        details.action_data = decode_action_data(
+            self._call_raw(tally_fn, encode_round_call(tally_fn, round_num, committees)),
+        )
+        if not details.action_data:
+            return details, True
 
         # Check veto status
-        is_vetoed = False
         try:
-            payload_addr = self.tally.functions.getPayloadAddress(
-                round_num, actions,
-            ).call()
-            is_vetoed = self.slasher.functions.vetoedPayloads(payload_addr).call()
+            payload_fn = self.tally.functions.getPayloadAddress(round_num, [])
+            actions = (len(details.action_data) // ACTION_SIZE).to_bytes(32, "big") + details.action_data
+            details.payload = decode_result(
+                payload_fn, self._call_raw(payload_fn, encode_round_call(payload_fn, round_num, actions)),
+            )
+            details.is_vetoed = self._call(self.slasher.functions.vetoedPayloads(details.payload))
         except Exception as e:
-            logger.warning("Failed to check veto status for round %d: %s", round_num, e)
+            self.log.warning("Failed to check veto status for round %d: %s", round_num, e)
+            return details, False
 
-        # Check if any of our validators are targeted
-        for action in actions:
-            validator_addr = action[0].lower() if isinstance(action, (list, tuple)) else action["validator"].lower()
-            slash_amount = action[1] if isinstance(action, (list, tuple)) else action["slashAmount"]
-
-            if validator_addr in self.our_addresses:
-                new_validator_labels.add((round_label, validator_addr))
-                OUR_VALIDATOR_TARGETED.labels(
-                    round=round_label, validator=validator_addr,
-                ).set(1)
-                OUR_VALIDATOR_SLASH_AMOUNT.labels(
-                    round=round_label, validator=validator_addr,
-                ).set(slash_amount)
-
-                logger.warning(
-                    "SLASH TARGET: round=%d, validator=%s, amount=%d wei",
-                    round_num, validator_addr, slash_amount,
-                )
-
-        return is_vetoed
+        return details, True
 
 
 # ---------------------------------------------------------------------------
@@ -557,64 +2210,212 @@ class SlashingMonitor:
 # ---------------------------------------------------------------------------
 
 
-def main():
-    logger.info("=" * 60)
-    logger.info("Aztec Slashing Monitor starting")
-    logger.info("Network: %s", NETWORK)
-    logger.info("Poll interval: %ds", POLL_INTERVAL)
-    logger.info("Metrics port: %d", METRICS_PORT)
-    logger.info("Keystore path: %s", KEYSTORE_PATH)
-    logger.info("=" * 60)
+def run_poll(monitor: SlashingMonitor):
+    try:
+        with POLL_DURATION.labels(monitor.network).time():
+            monitor.poll()
+        POLL_SUCCESS.labels(monitor.network).inc()
+        LAST_POLL_TIMESTAMP.labels(monitor.network).set(time.time())
+    except Exception as e:
+        monitor.log.error("Poll failed: %s", e)
+        POLL_ERRORS.labels(monitor.network).inc()
 
-    if not L1_RPC_URL:
-        logger.error("L1_RPC_URL is required")
-        sys.exit(1)
 
-    # Use the first RPC URL if comma-separated
-    rpc_url = L1_RPC_URL.split(",")[0].strip()
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+def load_constants_in_background(monitor: SlashingMonitor) -> threading.Thread:
+    """
+    Read the contract constants from L1 on a background thread, retrying with
+    exponential backoff until it succeeds. Cached constants stay in use
+    meanwhile.
+    """
+    def run():
+        delay = CONSTANTS_RETRY_MIN
+        while True:
+            try:
+                monitor.load_constants()
+                return
+            except Exception as e:
+                monitor.log.warning("Failed to load contract constants, retrying in %ds: %s", delay, e)
+                time.sleep(delay)
+                delay = min(delay * 2, CONSTANTS_RETRY_MAX)
 
-    if not w3.is_connected():
-        logger.error("Failed to connect to L1 RPC at %s", rpc_url)
-        sys.exit(1)
+    thread = threading.Thread(target=run, name=f"constants-{monitor.network}", daemon=True)
+    thread.start()
+    return thread
 
-    logger.info("Connected to L1 RPC (chain_id=%d)", w3.eth.chain_id)
 
-    # Load our validator addresses from keystore
-    our_addresses = load_validator_addresses(KEYSTORE_PATH)
-    logger.info("Monitoring %d validator address(es): %s", len(our_addresses), our_addresses)
+def wait_for_next_poll(monitor: SlashingMonitor, interval: int):
+    """
+    Sleep until the next scheduled poll. With event-driven refresh enabled,
+    check Tally logs every LOG_POLL_INTERVAL seconds and return early as soon
+    as a log touches a round.
+    """
+    deadline = time.time() + interval
+    if LOG_POLL_INTERVAL <= 0:
+        time.sleep(interval)
+        return
+
+    while (remaining := deadline - time.time()) > 0:
+        time.sleep(min(LOG_POLL_INTERVAL, remaining))
+        try:
+            if monitor.check_logs():
+                return
+        except Exception as e:
+            monitor.log.warning("Failed to read Tally logs: %s", e)
 
-    # Initialize monitor
-    monitor = SlashingMonitor(w3, NETWORK, our_addresses)
 
-    logger.info("Loading contract constants...")
-    monitor.load_constants()
+def network_settings(network: str) -> tuple[list[str], str]:
+    """
+    Return the L1 RPC URLs and keystore path of a network. L1_RPC_URL_<NETWORK>
+    and KEYSTORE_PATH_<NETWORK> override the shared L1_RPC_URL and
+    KEYSTORE_PATH.
+    """
+    suffix = network.upper().replace("-", "_")
+    rpc_url = os.getenv(f"L1_RPC_URL_{suffix}") or L1_RPC_URL
+    keystore_path = os.getenv(f"KEYSTORE_PATH_{suffix}") or KEYSTORE_PATH
+    return [url.strip() for url in rpc_url.split(",") if url.strip()], keystore_path
 
-    # Start Prometheus HTTP server
-    start_http_server(METRICS_PORT)
-    logger.info("Prometheus metrics server started on :%d", METRICS_PORT)
 
-    # Initial poll
+def run_monitor(monitor: SlashingMonitor, keystore: KeystoreIndex):
+    """
+    Poll one network until the process exits. Errors are logged and retried
+    after MIN_POLL_INTERVAL, so one failing network cannot silently stop its
+    thread while the others keep running.
+    """
+    # Cached constants let the last known state be served right away; the L1
+    # read confirms them, or provides them on first start, in the background
+    try:
+        restored = monitor.restore_constants()
+    except Exception as e:
+        monitor.log.warning("Failed to read the chain ID: %s", e)
+        restored = False
+    if not restored:
+        monitor.log.info("No cached contract constants, waiting for L1...")
+    load_constants_in_background(monitor)
+    monitor.constants_ready.wait()
     try:
-        monitor.poll()
-        POLL_SUCCESS.inc()
-        LAST_POLL_TIMESTAMP.set(time.time())
+        monitor.restore_history()
     except Exception as e:
-        logger.error("Initial poll failed: %s", e)
-        POLL_ERRORS.inc()
+        monitor.log.warning("Failed to restore round history: %s", e)
+
+    # Initial poll
+    run_poll(monitor)
 
     # Main loop
     while True:
-        logger.info("Sleeping for %ds...", POLL_INTERVAL)
-        time.sleep(POLL_INTERVAL)
-
         try:
-            monitor.poll()
-            POLL_SUCCESS.inc()
-            LAST_POLL_TIMESTAMP.set(time.time())
+            interval = monitor.next_poll_interval()
+            NEXT_POLL_INTERVAL.labels(monitor.network).set(interval)
+            monitor.log.info("Sleeping for up to %ds...", interval)
+            wait_for_next_poll(monitor, interval)
+
+            addresses = keystore.refresh()
+            if addresses is not None:
+                monitor.log.info("Keystore changed, monitoring %d validator address(es)", len(addresses))
+                monitor.set_our_addresses(addresses)
         except Exception as e:
-            logger.error("Poll failed: %s", e)
-            POLL_ERRORS.inc()
+            monitor.log.error("Monitor loop failed: %s", e)
+            POLL_ERRORS.labels(monitor.network).inc()
+            time.sleep(MIN_POLL_INTERVAL)
+
+        run_poll(monitor)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Aztec slashing monitor")
+    parser.add_argument(
+        "--backfill", action="store_true",
+        help="record every round up to the current one in a SQLite history and exit",
+    )
+    parser.add_argument(
+        "--network", default=NETWORKS[0] if NETWORKS else None,
+        help="network to backfill (default: the first configured network)",
+    )
+    parser.add_argument("--from-round", type=int, default=0, help="first round to backfill")
+    parser.add_argument("--to-round", type=int, default=None, help="last round to backfill (default: current)")
+    parser.add_argument("--chunk-size", type=int, default=BACKFILL_CHUNK_SIZE, help="rounds per checkpointed chunk")
+    parser.add_argument(
+        "--output", default=None,
+        help="backfill SQLite file (default: DATA_PATH/slash-monitor-backfill.sqlite)",
+    )
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    networks = [args.network] if args.backfill else NETWORKS
+
+    logger.info("=" * 60)
+    logger.info("Aztec Slashing Monitor starting")
+    logger.info("Networks: %s", ", ".join(networks))
+    logger.info("Poll interval: %ds", POLL_INTERVAL)
+    logger.info("Metrics port: %d", METRICS_PORT)
+    logger.info("=" * 60)
+
+    if not networks:
+        logger.error("NETWORK is required")
+        sys.exit(1)
+    settings = {network: network_settings(network) for network in networks}
+    for network, (rpc_urls, _) in settings.items():
+        if not rpc_urls:
+            logger.error("L1_RPC_URL is required for %s", network)
+            sys.exit(1)
+
+    # Serve metrics before any L1 request, so the scrape target is up while
+    # the RPC is slow or unreachable
+    if not args.backfill:
+        start_http_server(METRICS_PORT)
+        logger.info("Prometheus metrics server started on :%d", METRICS_PORT)
+
+    # Caches and the detail pool are shared; each network gets its own RPC
+    # provider, keystore and history connection
+    address_cache = AddressCache(Path(DATA_PATH) / "attester-addresses.json" if DATA_PATH else None)
+    constants_cache = ConstantsCache(Path(DATA_PATH) / "slash-monitor-constants.json" if DATA_PATH else None)
+    executor = ThreadPoolExecutor(max_workers=DETAIL_WORKERS, thread_name_prefix="round")
+
+    monitors = []
+    for network, (rpc_urls, keystore_path) in settings.items():
+        log = NetworkLogAdapter(logger, {"network": network})
+        provider = FailoverHTTPProvider(rpc_urls, network)
+        w3 = Web3(provider)
+        log.info(
+            "Using %d L1 RPC endpoint(s): %s",
+            len(rpc_urls), [endpoint.label for endpoint in provider.endpoints],
+        )
+
+        # Load our validator addresses from keystore
+        keystore = KeystoreIndex(keystore_path, address_cache)
+        our_addresses = keystore.refresh() or []
+        log.info(
+            "Monitoring %d validator address(es) from %s: %s",
+            len(our_addresses), keystore_path, our_addresses,
+        )
+
+        history = None
+        if DATA_PATH:
+            history = RoundHistoryStore(Path(DATA_PATH) / "slash-monitor-rounds.sqlite")
+
+        monitor = SlashingMonitor(w3, network, our_addresses, history, executor, constants_cache)
+        monitors.append((monitor, keystore))
+
+    if args.backfill:
+        monitor = monitors[0][0]
+        monitor.log.info("Loading contract constants...")
+        monitor.load_constants()
+        output = args.output or str(Path(DATA_PATH or ".") / "slash-monitor-backfill.sqlite")
+        written = monitor.backfill(
+            BackfillStore(output), args.from_round, args.to_round, args.chunk_size,
+        )
+        monitor.log.info("Backfill complete: %d round(s) written to %s", written, output)
+        return
+
+    threads = [
+        threading.Thread(target=run_monitor, args=(monitor, keystore), name=monitor.network, daemon=True)
+        for monitor, keystore in monitors
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
 
 
 if __name__ == "__main__":